@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shared helpers for the incremental MainWindow test scripts: path setup,
+progress throttling and a base main window
+"""
+
+import os
+import sys
+import time
+
+from PyQt6.QtWidgets import QMainWindow, QVBoxLayout, QWidget, QTabWidget
+
+def add_project_root():
+    """Make the src package importable from the project root, once"""
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+class ProgressThrottle:
+    """Limit progress display to one update per interval, plus the final one"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._last_shown = 0.0
+
+    def ready(self, current, total):
+        """Whether the update for current out of total should be shown"""
+        now = time.monotonic()
+        if current != total and now - self._last_shown < self.interval:
+            return False
+        self._last_shown = now
+        return True
+
+class BaseTestWindow(QMainWindow):
+    """Main window with a central widget and layout, optionally holding views in tabs"""
+
+    def __init__(self, title):
+        super().__init__()
+        self.setWindowTitle(title)
+        self.resize(800, 600)
+
+    def _build_ui(self):
+        """
+        Run _setup_ui with updates suspended on the whole window, so widgets
+        added by subclasses after the base layout are covered too
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self._setup_ui()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _setup_ui(self, views=()):
+        """
+        Create the central widget and its layout. views is a sequence of
+        (attribute, widget, tab title); each widget is stored on the window
+        under attribute and added as a tab.
+        """
+        # Create central widget
+        self.central_widget = QWidget()
+        self.setCentralWidget(self.central_widget)
+
+        # Create layout
+        self.main_layout = QVBoxLayout(self.central_widget)
+
+        if views:
+            # Create tab widget
+            self.tab_widget = QTabWidget()
+            for attr, view, title in views:
+                setattr(self, attr, view)
+                self.tab_widget.addTab(view, title)
+
+            # Add tab widget to main layout
+            self.main_layout.addWidget(self.tab_widget)
+
+        return self.main_layout
@@ -8,17 +8,26 @@ Bare minimum test application to isolate segmentation fault
 import sys
 import os
 import logging
+from importlib import import_module
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+# Set up logging (set BARE_MIN_DEBUG=1 for verbose output)
+logging.basicConfig(level=logging.DEBUG if os.environ.get('BARE_MIN_DEBUG') else logging.WARNING)
 logger = logging.getLogger("BareMinimum")
 
-# Add src directory to path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
+# Minimum interval between progress label updates, in seconds
+PROGRESS_UPDATE_INTERVAL = 0.05
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton
-from PyQt6.QtCore import pyqtSignal, QObject
+
+# Make the src package importable
+from _test_common import ProgressThrottle, add_project_root
+add_project_root()
+
+
+def _cached_import(module_path, attr, _modules=sys.modules):
+    """Return an attribute from a module, importing it only if not loaded yet"""
+    module = _modules.get(module_path) or import_module(module_path)
+    return getattr(module, attr)
 
 # Create a simple window that doesn't import any project modules
 class SimpleWindow(QMainWindow):
@@ -34,85 +43,95 @@ class SimpleWindow(QMainWindow):
         
         # Create layout
         layout = QVBoxLayout(central_widget)
+        layout.setContentsMargins(6, 6, 6, 6)
+        layout.setSpacing(4)
         
         # Add label
         label = QLabel("This is a bare minimum test application")
         layout.addWidget(label)
         
-        # Add button for next step
-        button1 = QPushButton("Step 1: Import DiskScanner")
-        button1.clicked.connect(self.step1_import_scanner)
-        layout.addWidget(button1)
-        
-        # Add button for next step
-        button2 = QPushButton("Step 2: Create DiskScanner")
-        button2.clicked.connect(self.step2_create_scanner)
-        layout.addWidget(button2)
-        
-        # Add button for next step
-        button3 = QPushButton("Step 3: Connect Signals")
-        button3.clicked.connect(self.step3_connect_signals)
-        layout.addWidget(button3)
-        
-        # Add button for next step
-        button4 = QPushButton("Step 4: Test Signals")
-        button4.clicked.connect(self.step4_test_signals)
-        layout.addWidget(button4)
+        # Add a button for each step
+        steps = [
+            ("Step 1: Import DiskScanner", self.step1_import_scanner),
+            ("Step 2: Create DiskScanner", self.step2_create_scanner),
+            ("Step 3: Connect Signals", self.step3_connect_signals),
+            ("Step 4: Test Signals", self.step4_test_signals),
+        ]
+        self._buttons = []
+        for text, slot in steps:
+            button = QPushButton(text)
+            button.clicked.connect(slot)
+            layout.addWidget(button)
+            self._buttons.append(button)
         
         # Add status label
         self.status_label = QLabel("Ready")
         layout.addWidget(self.status_label)
         
+        # Scanner is created by step 2 (or step 3 if step 2 was skipped)
+        self.scanner = None
+        
+        self._progress_throttle = ProgressThrottle(PROGRESS_UPDATE_INTERVAL)
+        
         logger.debug("SimpleWindow initialized")
     
+    def _set_buttons_enabled(self, enabled):
+        """Enable or disable all step buttons"""
+        for button in self._buttons:
+            button.setEnabled(enabled)
+    
     def step1_import_scanner(self):
         """Import scanner module step by step"""
         try:
             logger.debug("Importing DiskScanner...")
-            from src.core.scanner import DiskScanner
+            DiskScanner = _cached_import('src.core.scanner', 'DiskScanner')
             logger.debug("DiskScanner imported successfully")
             self.status_label.setText("DiskScanner imported successfully")
         except Exception as e:
-            logger.error(f"Error importing DiskScanner: {e}", exc_info=True)
+            logger.error("Error importing DiskScanner: %s", e, exc_info=True)
             self.status_label.setText(f"Error: {str(e)}")
     
     def step2_create_scanner(self):
         """Create scanner instance"""
         try:
             logger.debug("Creating DiskScanner instance...")
-            from src.core.scanner import DiskScanner
+            DiskScanner = _cached_import('src.core.scanner', 'DiskScanner')
             self.scanner = DiskScanner()
             logger.debug("DiskScanner instance created")
             self.status_label.setText("DiskScanner instance created")
         except Exception as e:
-            logger.error(f"Error creating DiskScanner: {e}", exc_info=True)
+            logger.error("Error creating DiskScanner: %s", e, exc_info=True)
             self.status_label.setText(f"Error: {str(e)}")
     
     def step3_connect_signals(self):
         """Connect scanner signals"""
         try:
             logger.debug("Connecting scanner signals...")
-            if not hasattr(self, 'scanner'):
-                from src.core.scanner import DiskScanner
+            if self.scanner is None:
+                DiskScanner = _cached_import('src.core.scanner', 'DiskScanner')
                 self.scanner = DiskScanner()
             
             # Connect signals
-            self.scanner.scan_started.connect(self.on_scan_started)
-            self.scanner.scan_progress.connect(self.on_scan_progress)
-            self.scanner.scan_finished.connect(self.on_scan_finished)
-            self.scanner.scan_error.connect(self.on_scan_error)
+            scanner = self.scanner
+            for signal, slot in (
+                (scanner.scan_started, self.on_scan_started),
+                (scanner.scan_progress, self.on_scan_progress),
+                (scanner.scan_finished, self.on_scan_finished),
+                (scanner.scan_error, self.on_scan_error),
+            ):
+                signal.connect(slot)
             
             logger.debug("Scanner signals connected")
             self.status_label.setText("Scanner signals connected")
         except Exception as e:
-            logger.error(f"Error connecting signals: {e}", exc_info=True)
+            logger.error("Error connecting signals: %s", e, exc_info=True)
             self.status_label.setText(f"Error: {str(e)}")
     
     def step4_test_signals(self):
         """Test emitting scanner signals"""
         try:
             logger.debug("Testing scanner signals...")
-            if not hasattr(self, 'scanner'):
+            if self.scanner is None:
                 self.status_label.setText("Error: Scanner not created")
                 return
             
@@ -128,38 +147,42 @@ class SimpleWindow(QMainWindow):
             logger.debug("Signals emitted successfully")
             self.status_label.setText("Signals emitted successfully")
         except Exception as e:
-            logger.error(f"Error emitting signals: {e}", exc_info=True)
+            logger.error("Error emitting signals: %s", e, exc_info=True)
             self.status_label.setText(f"Error: {str(e)}")
     
     def on_scan_started(self, path):
         """Handle scan started signal"""
-        logger.debug(f"on_scan_started called with path={path}")
+        logger.debug("on_scan_started called with path=%s", path)
+        # Prevent re-entrant clicks while a scan is running
+        self._set_buttons_enabled(False)
         self.status_label.setText(f"Scan started: {path}")
     
     def on_scan_progress(self, current, total, current_path):
         """Handle scan progress signal"""
-        logger.debug(f"on_scan_progress called with current={current}, total={total}, current_path={current_path}")
+        if not self._progress_throttle.ready(current, total):
+            return
+        
+        logger.debug("on_scan_progress called with current=%s, total=%s, current_path=%s", current, total, current_path)
+        # Called once per scanned file, so resolve the label method once
+        set_text = self.status_label.setText
         try:
-            # Convert parameters to integers if they're strings
-            if isinstance(current, str):
-                current = int(current)
-            if isinstance(total, str):
-                total = int(total)
-            
-            percent = int((current / total) * 100) if total > 0 else 0
-            self.status_label.setText(f"Progress: {percent}% - {current_path}")
+            # scan_progress is declared as (int, int, str), so no coercion is needed
+            percent = (current * 100) // total if total > 0 else 0
+            set_text(f"Progress: {percent}% - {current_path}")
         except Exception as e:
-            logger.error(f"Error handling progress: {e}", exc_info=True)
-            self.status_label.setText(f"Progress error: {str(e)}")
+            logger.error("Error handling progress: %s", e, exc_info=True)
+            set_text(f"Progress error: {str(e)}")
     
     def on_scan_finished(self, results):
         """Handle scan finished signal"""
-        logger.debug(f"on_scan_finished called with results={results}")
+        logger.debug("on_scan_finished called with results=%s", results)
+        self._set_buttons_enabled(True)
         self.status_label.setText("Scan finished")
     
     def on_scan_error(self, error_message):
         """Handle scan error signal"""
-        logger.debug(f"on_scan_error called with error_message={error_message}")
+        logger.debug("on_scan_error called with error_message=%s", error_message)
+        self._set_buttons_enabled(True)
         self.status_label.setText(f"Error: {error_message}")
 
 def main():
@@ -173,4 +196,4 @@ if __name__ == "__main__":
     try:
         sys.exit(main())
     except Exception as e:
-        logger.error(f"Unhandled exception: {e}", exc_info=True) 
\ No newline at end of file
+        logger.error("Unhandled exception: %s", e, exc_info=True) 
\ No newline at end of file
@@ -19,9 +19,9 @@ def main():
         if i >= 10:  # Only check the first 10 entries
             break
             
-        if entry.is_file():
+        if entry.is_file(follow_symlinks=False):
             try:
-                size = os.path.getsize(entry.path)
+                size = entry.stat(follow_symlinks=False).st_size
                 print(f"File: {entry.name}, Size: {size} bytes ({size / (1024**3):.6f} GB)")
                 total_size += size
                 file_count += 1
@@ -35,16 +35,31 @@ def main():
     total_size = 0
     file_count = 0
     
-    for root, dirs, files in os.walk(downloads_path):
-        for file in files:
-            try:
-                file_path = os.path.join(root, file)
-                if os.path.isfile(file_path):
-                    size = os.path.getsize(file_path)
-                    total_size += size
-                    file_count += 1
-            except Exception:
-                pass  # Ignore errors for this quick check
+    # Walk with an explicit stack of directories; DirEntry caches the type
+    # and stat data, so no extra syscalls are needed per file. Symlinks are
+    # never followed, and hard links are only counted once.
+    stack = [downloads_path]
+    seen_inodes = set()
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            if stat.st_nlink > 1:
+                                inode_key = (stat.st_dev, stat.st_ino)
+                                if inode_key in seen_inodes:
+                                    continue
+                                seen_inodes.add(inode_key)
+                            total_size += stat.st_size
+                            file_count += 1
+                    except OSError:
+                        pass  # Ignore errors for this quick check
+        except OSError:
+            pass  # Unreadable directory
     
     print(f"Found {file_count} files with total size: {total_size} bytes ({total_size / (1024**3):.6f} GB)")
 
@@ -8,6 +8,9 @@ Diagnostic script to check scan results structure
 import os
 import sys
 import logging
+import functools
+from itertools import islice
+from operator import methodcaller
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QObject
 
@@ -22,27 +25,38 @@ logging.basicConfig(level=logging.DEBUG,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("ScanChecker")
 
+# Scanner settings used for diagnostic runs
+SCAN_CONFIG = {
+    'max_threads': 2,
+    'calculate_hashes': False,
+    'skip_hidden': False,
+    'exclude_paths': ()
+}
+
+def _fast_hr(size, _units=('B', 'KB', 'MB', 'GB', 'TB', 'PB'),
+             _scales=(1, 1 << 10, 1 << 20, 1 << 30, 1 << 40, 1 << 50)):
+    """Format a byte count using its bit length to pick the unit"""
+    i = min((size.bit_length() - 1) // 10, len(_units) - 1) if size > 0 else 0
+    if i == 0:
+        return f"{size} B"
+    return f"{size / _scales[i]:.2f} {_units[i]}"
+
+@functools.lru_cache(maxsize=16)
+def _cached_scan(path, config_items):
+    """Scan a path once per (path, config) pair and reuse the result"""
+    scanner = DiskScanner()
+    scanner.configure(dict(config_items))
+    return scanner.scan(path, is_blocking=True)
+
 class ScanChecker(QObject):
     """Class to run scan and check the results"""
     
-    def __init__(self):
-        super().__init__()
-        self.scanner = DiskScanner()
-    
     def run_scan(self, path):
         """Run a scan and analyze the results"""
         logger.info(f"Starting scan of {path}")
         
-        # Configure scanner with debug settings
-        self.scanner.configure({
-            'max_threads': 2,
-            'calculate_hashes': False,
-            'skip_hidden': False,
-            'exclude_paths': []
-        })
-        
-        # Run scan in blocking mode
-        result = self.scanner.scan(path, is_blocking=True)
+        # Run scan in blocking mode with debug settings, reusing earlier results
+        result = _cached_scan(path, tuple(sorted(SCAN_CONFIG.items())))
         
         # Check if result exists
         if not result:
@@ -74,10 +88,10 @@ class ScanChecker(QObject):
         # Sample some files to check sizes
         file_sizes = 0
         large_files = 0
-        for i, (file_path, file_info) in enumerate(list(files.items())[:10]):
+        for i, (file_path, file_info) in enumerate(islice(files.items(), 10)):
             size = file_info.get('size', 0)
             file_sizes += size
-            logger.info(f"Sample file {i+1}: {file_path} - Size: {size} bytes ({human_readable_size(size)})")
+            logger.info(f"Sample file {i+1}: {file_path} - Size: {size} bytes ({_fast_hr(size)})")
             if size > 1024*1024:  # Files larger than 1MB
                 large_files += 1
         
@@ -87,7 +101,7 @@ class ScanChecker(QObject):
             logger.info(f"Number of large files in sample: {large_files}")
             
         # Check the sum of file sizes vs. reported total
-        manual_sum = sum(file_info.get('size', 0) for file_info in files.values())
+        manual_sum = sum(map(methodcaller('get', 'size', 0), files.values()))
         logger.info(f"Sum of all file sizes: {manual_sum} bytes ({human_readable_size(manual_sum)})")
         logger.info(f"Difference between sum and reported total: {manual_sum - total_size} bytes")
         
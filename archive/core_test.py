@@ -39,6 +39,8 @@ class CoreTestWindow(QMainWindow):
         
         # Create layout
         layout = QVBoxLayout(central_widget)
+        layout.setContentsMargins(6, 6, 6, 6)
+        layout.setSpacing(4)
         
         # Add a label
         label = QLabel("Test for core modules DiskScanner and DataAnalyzer")
@@ -11,9 +11,6 @@ import os
 import logging
 import traceback
 import signal
-import inspect
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import pyqtSignal, QObject, QMetaObject
 
 # Set up extremely verbose logging
 logging.basicConfig(
@@ -32,67 +29,73 @@ logger.setLevel(logging.DEBUG)
 src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
 sys.path.insert(0, src_dir)
 
-# Monkey patch pyqtSignal.connect to log connections
-original_connect = pyqtSignal.connect
+def install_debug_hooks():
+    """Import the Qt and application modules and wrap them with debug logging
 
-def debug_connect(self, slot):
-    logger.debug(f"SIGNAL CONNECT: {self} -> {slot.__qualname__ if hasattr(slot, '__qualname__') else str(slot)}")
-    return original_connect(self, slot)
+    These imports are deferred until the application is started so that
+    importing this module does not pay the PyQt load cost.
+    """
+    from PyQt6.QtCore import pyqtSignal
 
-pyqtSignal.connect = debug_connect
+    # Monkey patch pyqtSignal.connect to log connections
+    original_connect = pyqtSignal.connect
 
-# Monkey patch QMetaObject.invokeMethod to log signal emissions
-original_invoke = QMetaObject.invokeMethod
+    def debug_connect(self, slot):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SIGNAL CONNECT: %s -> %s", self, getattr(slot, '__qualname__', slot))
+        return original_connect(self, slot)
 
-def debug_invoke(obj, *args, **kwargs):
-    logger.debug(f"SIGNAL INVOKE: {obj} with args={args}, kwargs={kwargs}")
-    return original_invoke(obj, *args, **kwargs)
+    pyqtSignal.connect = debug_connect
 
-QMetaObject.invokeMethod = debug_invoke
+    # Import wrapped scanner class
+    from src.core.scanner import DiskScanner
 
-# Import wrapped scanner class
-from src.core.scanner import DiskScanner
+    # Add debug logging to DiskScanner
+    original_emit = pyqtSignal.emit
 
-# Add debug logging to DiskScanner
-original_emit = pyqtSignal.emit
+    def debug_emit(self, *args):
+        # Log signal emissions with parameter types
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SIGNAL EMIT: %s with args: %s", getattr(self, 'signal', self),
+                         [(arg, type(arg).__name__) for arg in args])
+        return original_emit(self, *args)
 
-def debug_emit(self, *args):
-    # Log signal emissions with parameter types
-    signal_name = getattr(self, 'signal', str(self))
-    param_types = [f"{arg}({type(arg).__name__})" for arg in args]
-    logger.debug(f"SIGNAL EMIT: {signal_name} with args: {param_types}")
-    return original_emit(self, *args)
+    for attr_name in dir(DiskScanner):
+        attr = getattr(DiskScanner, attr_name)
+        if isinstance(attr, pyqtSignal):
+            # Set a descriptive name for better logging
+            attr.signal = f"DiskScanner.{attr_name}"
+            # Monkey patch this specific signal's emit method
+            attr.emit = debug_emit.__get__(attr)
 
-for attr_name in dir(DiskScanner):
-    attr = getattr(DiskScanner, attr_name)
-    if isinstance(attr, pyqtSignal):
-        # Set a descriptive name for better logging
-        attr.signal = f"DiskScanner.{attr_name}"
-        # Monkey patch this specific signal's emit method
-        attr.emit = debug_emit.__get__(attr)
+    # Add stack trace info to key methods
+    original_scan = DiskScanner.scan
 
-# Add stack trace info to key methods
-original_scan = DiskScanner.scan
+    def debug_scan(self, *args, **kwargs):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ENTERING: DiskScanner.scan with args=%s, kwargs=%s", args, kwargs)
+            logger.debug("STACK: %s", traceback.format_stack())
+        return original_scan(self, *args, **kwargs)
 
-def debug_scan(self, *args, **kwargs):
-    logger.debug(f"ENTERING: DiskScanner.scan with args={args}, kwargs={kwargs}")
-    logger.debug(f"STACK: {traceback.format_stack()}")
-    return original_scan(self, *args, **kwargs)
+    DiskScanner.scan = debug_scan
 
-DiskScanner.scan = debug_scan
+    # Import the main window with debugging enhancements
+    from src.ui.main_window import MainWindow
 
-# Import the main window with debugging enhancements
-from src.ui.main_window import MainWindow
+    # Add debug logging to main window signal handlers
+    original_on_scan_progress = MainWindow._on_scan_progress
 
-# Add debug logging to main window signal handlers
-original_on_scan_progress = MainWindow._on_scan_progress
+    def debug_on_scan_progress(self, *args, **kwargs):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("HANDLER: MainWindow._on_scan_progress called with args=%s, kwargs=%s",
+                         [(arg, type(arg).__name__) for arg in args], kwargs)
+            caller = sys._getframe(1)
+            logger.debug("CALLER: %s:%s", caller.f_code.co_filename, caller.f_lineno)
+        return original_on_scan_progress(self, *args, **kwargs)
 
-def debug_on_scan_progress(self, *args, **kwargs):
-    logger.debug(f"HANDLER: MainWindow._on_scan_progress called with args={[f'{arg}({type(arg).__name__})' for arg in args]}, kwargs={kwargs}")
-    logger.debug(f"STACK: {traceback.format_stack()[-5:]}")
-    return original_on_scan_progress(self, *args, **kwargs)
+    MainWindow._on_scan_progress = debug_on_scan_progress
 
-MainWindow._on_scan_progress = debug_on_scan_progress
+    return MainWindow
 
 # Add signal handler for segmentation faults
 def handle_segfault(signum, frame):
@@ -108,6 +111,9 @@ def main():
     """Debug application entry point"""
     logger.info("Starting debug version of Storage Stats")
     
+    from PyQt6.QtWidgets import QApplication
+    MainWindow = install_debug_hooks()
+    
     # Print system information
     import platform
     logger.info(f"Python version: {platform.python_version()}")
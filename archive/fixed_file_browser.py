@@ -8,22 +8,26 @@ Fixed version of FileBrowserView that avoids segmentation faults
 import sys
 import os
 import logging
+from operator import itemgetter
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("FixedFileBrowser")
 
-# Add src directory to path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
+# Make the src package importable from the project root, once
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, 
     QTreeView, QHeaderView, QComboBox, QLineEdit, QToolBar
 )
-from PyQt6.QtCore import Qt, QSortFilterProxyModel, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QStandardItemModel, QStandardItem
 
+from src.utils.helpers import human_readable_size
+
 class SafeFileSystemModel(QStandardItemModel):
     """Safe model for displaying file system data"""
     
@@ -64,6 +68,10 @@ class FixedFileBrowserView(QWidget):
         logger.debug("Initializing FixedFileBrowserView")
         super().__init__(parent)
         
+        # (name, size) pairs from the last scan, filtered and sorted on display;
+        # None until update_view runs, so the demo rows are left alone
+        self._entries = None
+        
         # Create layout first
         self.layout = QVBoxLayout(self)
         
@@ -87,6 +95,8 @@ class FixedFileBrowserView(QWidget):
         sort_label = QLabel("Sort by:")
         self.sort_combo = QComboBox()
         self.sort_combo.addItems(["Name", "Size"])
+        self.sort_combo.setCurrentText("Size")
+        self.sort_combo.currentIndexChanged.connect(self._update_filter)
         toolbar.addWidget(sort_label)
         toolbar.addWidget(self.sort_combo)
         
@@ -95,8 +105,8 @@ class FixedFileBrowserView(QWidget):
         toolbar.addWidget(filter_label)
         toolbar.addWidget(self.filter_edit)
         
-        # Connect filter edit to proxy model
-        # self.filter_edit.textChanged.connect(self._update_filter)
+        # Re-populate the model when the filter changes
+        self.filter_edit.textChanged.connect(self._update_filter)
         
         self.layout.addWidget(toolbar)
         logger.debug("Toolbar created")
@@ -112,12 +122,9 @@ class FixedFileBrowserView(QWidget):
         # Create model and set it on the tree view BEFORE configuring the header
         self.model = SafeFileSystemModel(self)
         
-        # Create proxy model
-        self.proxy_model = QSortFilterProxyModel(self)
-        self.proxy_model.setSourceModel(self.model)
-        
-        # Set model on tree view
-        self.tree_view.setModel(self.proxy_model)
+        # Set model on tree view directly; rows are sorted and filtered in
+        # Python before insertion, so no proxy model is needed
+        self.tree_view.setModel(self.model)
         
         # NOW configure the header AFTER the model is set
         try:
@@ -137,19 +144,45 @@ class FixedFileBrowserView(QWidget):
         """Update view with scan results - safely implemented"""
         logger.debug("update_view called (safe implementation)")
         
-        # Clear the model first
-        self.model.clear()
-        
-        # Reset headers after clearing
-        self.model.setHeaderData(0, Qt.Orientation.Horizontal, "Name")
-        self.model.setHeaderData(1, Qt.Orientation.Horizontal, "Size")
-        
         # If we have results, show them
         if scan_results:
             logger.info(f"Updating view with scan results: {len(scan_results)} items")
-            # Add data safely...
+            self._entries = [
+                (os.path.basename(file_path), file_info.get('size', 0))
+                for file_path, file_info in scan_results.get('files', {}).items()
+            ]
         else:
             logger.warning("No scan results to show")
+            self._entries = []
+        
+        self._update_filter()
+    
+    def _update_filter(self, *args):
+        """Rebuild the model rows from the current filter text and sort choice"""
+        entries = self._entries
+        if entries is None:
+            return
+        
+        filter_text = self.filter_edit.text().lower()
+        if filter_text:
+            entries = [entry for entry in entries if filter_text in entry[0].lower()]
+        
+        if self.sort_combo.currentText() == "Size":
+            entries = sorted(entries, key=itemgetter(1), reverse=True)
+        else:
+            entries = sorted(entries, key=itemgetter(0))
+        
+        # Size the model once and fill the rows in place, rather than
+        # inserting them one at a time; the header labels are kept
+        self.model.setRowCount(len(entries))
+        
+        for row, (name, size) in enumerate(entries):
+            name_item = QStandardItem(name)
+            size_item = QStandardItem(human_readable_size(size))
+            name_item.setEditable(False)
+            size_item.setEditable(False)
+            self.model.setItem(row, 0, name_item)
+            self.model.setItem(row, 1, size_item)
 
 # Test main window to verify fixed components
 class TestMainWindow(QMainWindow):
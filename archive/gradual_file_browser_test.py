@@ -8,10 +8,10 @@ Gradual FileBrowserView test to identify the component causing segmentation faul
 import sys
 import os
 import logging
-import traceback
+import importlib
 
 # Set up logging
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("GradualFileBrowserTest")
 
 # Add src directory to path
@@ -20,28 +20,95 @@ sys.path.insert(0, src_dir)
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, 
-    QPushButton, QTreeView, QHeaderView, QToolBar, QComboBox
+    QPushButton, QTreeView, QHeaderView
 )
-from PyQt6.QtCore import Qt, QSortFilterProxyModel
-from PyQt6.QtGui import QStandardItemModel, QStandardItem
+from PyQt6.QtCore import (
+    Qt, QAbstractItemModel, QModelIndex, QSortFilterProxyModel, QSignalBlocker,
+    QThread, QTimer, pyqtSignal, pyqtSlot
+)
+
+# (name, size) labels for the demo model's child rows
+_DEMO_ROWS = tuple((f"Item {i}", f"{i*100} KB") for i in range(5))
+
+class DemoModel(QAbstractItemModel):
+    """
+    Two-level demo model: a single root row whose children are stored as
+    parallel name and size lists instead of one QStandardItem per cell
+    """
+    
+    HEADERS = ("Name", "Size")
+    
+    def __init__(self, root_row, rows, parent=None):
+        super().__init__(parent)
+        self._root_row = tuple(root_row)
+        self._names = [name for name, _ in rows]
+        self._sizes = [size for _, size in rows]
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column)
+        # Child indexes point at the child store; top-level ones carry nothing
+        return self.createIndex(row, column, self._names)
+    
+    def parent(self, index):
+        if index.isValid() and index.internalPointer() is self._names:
+            return self.createIndex(0, 0)
+        return QModelIndex()
+    
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return 1
+        if parent.internalPointer() is None and parent.column() == 0:
+            return len(self._names)
+        return 0
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if index.internalPointer() is None:
+            return self._root_row[index.column()]
+        column = self._names if index.column() == 0 else self._sizes
+        return column[index.row()]
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+class ModuleLoader(QThread):
+    """Import a module in a background thread"""
+    
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(object)
+    
+    def __init__(self, module_name, parent=None):
+        super().__init__(parent)
+        self.module_name = module_name
+    
+    def run(self):
+        try:
+            self.loaded.emit(importlib.import_module(self.module_name))
+        except Exception as e:
+            self.failed.emit(e)
 
 class GradualTestMainWindow(QMainWindow):
     def __init__(self):
-        logger.debug("Starting GradualTestMainWindow initialization")
         super().__init__()
         self.setWindowTitle("Gradual FileBrowserView Test")
         self.resize(800, 600)
         
         # Create central widget and layout
-        logger.debug("Creating central widget")
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         
-        logger.debug("Creating layout")
         self.layout = QVBoxLayout(self.central_widget)
         
         # Add status label
-        logger.debug("Creating status label")
         self.status_label = QLabel("Click buttons to test components")
         self.layout.addWidget(self.status_label)
         
@@ -53,66 +120,103 @@ class GradualTestMainWindow(QMainWindow):
         self.test_layout = QVBoxLayout(self.test_container)
         self.layout.addWidget(self.test_container)
         
-        logger.debug("GradualTestMainWindow initialization complete")
+        # Demo model shared by the model-based tests, created on first use
+        self._demo_model = None
+        
+        # Import the real file browser module off the GUI thread
+        self._fbv_module = None
+        self._fbv_error = None
+        # Actions waiting for that import to finish
+        self._fbv_pending = []
+        self._fbv_loader = ModuleLoader("ui.file_browser_view", self)
+        self._fbv_loader.loaded.connect(self._on_fbv_loaded)
+        self._fbv_loader.failed.connect(self._on_fbv_failed)
+        self._fbv_loader.start()
+        
+        logger.debug("GradualTestMainWindow initialized: central widget, layout, "
+                     "status label, test buttons and test container created")
     
     def create_test_buttons(self):
-        logger.debug("Creating test buttons")
-        
         button_layout = QVBoxLayout()
         
-        # Button 1: Create basic QTreeView
-        self.basic_tree_button = QPushButton("1. Create Basic QTreeView")
-        self.basic_tree_button.clicked.connect(self.create_basic_tree_view)
-        button_layout.addWidget(self.basic_tree_button)
-        
-        # Button 2: Create QTreeView with headers
-        self.header_tree_button = QPushButton("2. Create QTreeView with Headers")
-        self.header_tree_button.clicked.connect(self.create_tree_with_headers)
-        button_layout.addWidget(self.header_tree_button)
-        
-        # Button 3: Create QTreeView with model
-        self.model_tree_button = QPushButton("3. Create QTreeView with Model")
-        self.model_tree_button.clicked.connect(self.create_tree_with_model)
-        button_layout.addWidget(self.model_tree_button)
-        
-        # Button 4: Create QTreeView with model and proxy
-        self.proxy_tree_button = QPushButton("4. Create QTreeView with Model + Proxy")
-        self.proxy_tree_button.clicked.connect(self.create_tree_with_proxy)
-        button_layout.addWidget(self.proxy_tree_button)
-        
-        # Button 5: Create complete simple file browser
-        self.complete_button = QPushButton("5. Create Complete Simple File Browser")
-        self.complete_button.clicked.connect(self.create_complete_file_browser)
-        button_layout.addWidget(self.complete_button)
-        
-        # Button 6: Try importing FileSystemModel from real code
-        self.import_model_button = QPushButton("6. Try importing FileSystemModel")
-        self.import_model_button.clicked.connect(self.try_import_real_model)
-        button_layout.addWidget(self.import_model_button)
-        
-        # Button 7: Try creating real FileBrowserView 
-        self.create_real_view_button = QPushButton("7. Try creating real FileBrowserView")
-        self.create_real_view_button.clicked.connect(self.try_create_real_view)
-        button_layout.addWidget(self.create_real_view_button)
+        # One button per test step, in order
+        specs = [
+            ("1. Create Basic QTreeView", self.create_basic_tree_view),
+            ("2. Create QTreeView with Headers", self.create_tree_with_headers),
+            ("3. Create QTreeView with Model", self.create_tree_with_model),
+            ("4. Create QTreeView with Model + Proxy", self.create_tree_with_proxy),
+            ("5. Create Complete Simple File Browser", self.create_complete_file_browser),
+            ("6. Try importing FileSystemModel", self.try_import_real_model),
+            ("7. Try creating real FileBrowserView", self.try_create_real_view),
+        ]
+        for label, handler in specs:
+            button = QPushButton(label)
+            button.clicked.connect(handler)
+            button_layout.addWidget(button)
         
         # Add button layout to main layout
         self.layout.addLayout(button_layout)
+
+    
+    def _on_fbv_loaded(self, module):
+        """Store the file browser module once the background import finishes"""
+        self._fbv_module = module
+        self._run_fbv_pending()
+    
+    def _on_fbv_failed(self, error):
+        """Store the background import error so the handlers can report it"""
+        self._fbv_error = error
+        self._run_fbv_pending()
+    
+    def _run_fbv_pending(self):
+        """Run the actions that were waiting for the background import"""
+        pending, self._fbv_pending = self._fbv_pending, []
+        for action in pending:
+            action()
+    
+    def _after_fbv_load(self, action):
+        """Run action now if the background import has finished, else once it does"""
+        if self._fbv_module is None and self._fbv_error is None:
+            self.status_label.setText("Waiting for ui.file_browser_view to load...")
+            if action not in self._fbv_pending:
+                self._fbv_pending.append(action)
+            return
+        action()
+    
+    def _get_fbv_module(self):
+        """
+        Return the file browser module
         
-        logger.debug("Test buttons created")
+        Raises the background import error if the import failed.
+        """
+        if self._fbv_error is not None:
+            raise self._fbv_error
+        return self._fbv_module
+    
+    def _get_demo_model(self):
+        """Return the demo item model, building it on first use"""
+        if self._demo_model is None:
+            self._demo_model = DemoModel(("Root", "0 B"), _DEMO_ROWS, self)
+        
+        return self._demo_model
     
     def clear_test_container(self):
         """Clear the test container before adding new widgets"""
         logger.debug("Clearing test container")
-        # Remove all widgets from the layout
-        while self.test_layout.count():
-            item = self.test_layout.takeAt(0)
-            widget = item.widget()
+        # Remove all widgets from the layout, last first, with updates
+        # suspended so the container is only re-laid out once
+        self.test_container.setUpdatesEnabled(False)
+        for i in reversed(range(self.test_layout.count())):
+            widget = self.test_layout.takeAt(i).widget()
             if widget:
+                widget.setParent(None)
                 widget.deleteLater()
+        self.test_container.setUpdatesEnabled(True)
         
         # Reset status
         self.status_label.setText("Test container cleared")
     
+    @pyqtSlot()
     def create_basic_tree_view(self):
         """Create a basic QTreeView with no model or headers"""
         logger.debug("Creating basic QTreeView")
@@ -125,9 +229,10 @@ class GradualTestMainWindow(QMainWindow):
             self.status_label.setText("Basic QTreeView created successfully")
             logger.debug("Basic QTreeView created successfully")
         except Exception as e:
-            logger.error(f"Error creating basic QTreeView: {e}", exc_info=True)
+            logger.error("Error creating basic QTreeView: %s", e, exc_info=True)
             self.status_label.setText(f"Error: {e}")
     
+    @pyqtSlot()
     def create_tree_with_headers(self):
         """Create a QTreeView with configured headers"""
         logger.debug("Creating QTreeView with headers")
@@ -135,21 +240,23 @@ class GradualTestMainWindow(QMainWindow):
             self.clear_test_container()
             
             tree_view = QTreeView()
-            tree_view.setAlternatingRowColors(True)
             
             # Configure header
             header = tree_view.header()
             header.setSectionsMovable(False)
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(0, 400)
+            header.resizeSection(1, 120)
             
             self.test_layout.addWidget(tree_view)
             
             self.status_label.setText("QTreeView with headers created successfully")
             logger.debug("QTreeView with headers created successfully")
         except Exception as e:
-            logger.error(f"Error creating QTreeView with headers: {e}", exc_info=True)
+            logger.error("Error creating QTreeView with headers: %s", e, exc_info=True)
             self.status_label.setText(f"Error: {e}")
     
+    @pyqtSlot()
     def create_tree_with_model(self):
         """Create a QTreeView with a standard item model"""
         logger.debug("Creating QTreeView with model")
@@ -157,40 +264,29 @@ class GradualTestMainWindow(QMainWindow):
             self.clear_test_container()
             
             tree_view = QTreeView()
-            tree_view.setAlternatingRowColors(True)
-            
-            # Configure header
-            header = tree_view.header()
-            header.setSectionsMovable(False)
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-            
-            # Create model
-            model = QStandardItemModel(0, 2)
-            model.setHeaderData(0, Qt.Orientation.Horizontal, "Name")
-            model.setHeaderData(1, Qt.Orientation.Horizontal, "Size")
             
-            # Add some items
-            root_item = QStandardItem("Root")
-            size_item = QStandardItem("0 B")
-            model.appendRow([root_item, size_item])
-            
-            # Add child items
-            for i in range(5):
-                child_item = QStandardItem(f"Item {i}")
-                child_size = QStandardItem(f"{i*100} KB")
-                root_item.appendRow([child_item, child_size])
+            # Get the shared demo model
+            model = self._get_demo_model()
             
             # Set model on tree view
             tree_view.setModel(model)
             
+            # Configure header once the model provides the columns
+            header = tree_view.header()
+            header.setSectionsMovable(False)
+            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(0, 400)
+            header.resizeSection(1, 120)
+            
             self.test_layout.addWidget(tree_view)
             
             self.status_label.setText("QTreeView with model created successfully")
             logger.debug("QTreeView with model created successfully")
         except Exception as e:
-            logger.error(f"Error creating QTreeView with model: {e}", exc_info=True)
+            logger.error("Error creating QTreeView with model: %s", e, exc_info=True)
             self.status_label.setText(f"Error: {e}")
     
+    @pyqtSlot()
     def create_tree_with_proxy(self):
         """Create a QTreeView with model and proxy model"""
         logger.debug("Creating QTreeView with model and proxy")
@@ -198,50 +294,46 @@ class GradualTestMainWindow(QMainWindow):
             self.clear_test_container()
             
             tree_view = QTreeView()
-            tree_view.setAlternatingRowColors(True)
-            
-            # Configure header
-            header = tree_view.header()
-            header.setSectionsMovable(False)
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-            
-            # Create model
-            model = QStandardItemModel(0, 2)
-            model.setHeaderData(0, Qt.Orientation.Horizontal, "Name")
-            model.setHeaderData(1, Qt.Orientation.Horizontal, "Size")
             
-            # Add some items
-            root_item = QStandardItem("Root")
-            size_item = QStandardItem("0 B")
-            model.appendRow([root_item, size_item])
-            
-            # Add child items
-            for i in range(5):
-                child_item = QStandardItem(f"Item {i}")
-                child_size = QStandardItem(f"{i*100} KB")
-                root_item.appendRow([child_item, child_size])
+            # Get the shared demo model
+            model = self._get_demo_model()
             
             # Create proxy model
             proxy_model = QSortFilterProxyModel()
-            proxy_model.setSourceModel(model)
+            proxy_model.setDynamicSortFilter(False)
+            # Nothing is attached to the proxy yet, so skip its layout signals
+            with QSignalBlocker(proxy_model):
+                proxy_model.setSourceModel(model)
             
-            # Set model on tree view
+            # Set model on tree view, then let the proxy track changes again
             tree_view.setModel(proxy_model)
+            proxy_model.setDynamicSortFilter(True)
+            
+            # Configure header once the model provides the columns
+            header = tree_view.header()
+            header.setSectionsMovable(False)
+            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(0, 400)
+            header.resizeSection(1, 120)
             
             self.test_layout.addWidget(tree_view)
             
             self.status_label.setText("QTreeView with model and proxy created successfully")
             logger.debug("QTreeView with model and proxy created successfully")
         except Exception as e:
-            logger.error(f"Error creating QTreeView with model and proxy: {e}", exc_info=True)
+            logger.error("Error creating QTreeView with model and proxy: %s", e, exc_info=True)
             self.status_label.setText(f"Error: {e}")
     
+    @pyqtSlot()
     def create_complete_file_browser(self):
         """Create a complete simple file browser with all components"""
         logger.debug("Creating complete simple file browser")
         try:
             self.clear_test_container()
             
+            # Toolbar widgets are only needed for this test
+            from PyQt6.QtWidgets import QToolBar, QComboBox
+            
             # Create container widget with layout
             browser_widget = QWidget()
             browser_layout = QVBoxLayout(browser_widget)
@@ -257,35 +349,27 @@ class GradualTestMainWindow(QMainWindow):
             
             # Create tree view
             tree_view = QTreeView()
-            tree_view.setAlternatingRowColors(True)
             
-            # Configure header
-            header = tree_view.header()
-            header.setSectionsMovable(False)
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-            
-            # Create model
-            model = QStandardItemModel(0, 2)
-            model.setHeaderData(0, Qt.Orientation.Horizontal, "Name")
-            model.setHeaderData(1, Qt.Orientation.Horizontal, "Size")
-            
-            # Add some items
-            root_item = QStandardItem("Root")
-            size_item = QStandardItem("0 B")
-            model.appendRow([root_item, size_item])
-            
-            # Add child items
-            for i in range(5):
-                child_item = QStandardItem(f"Item {i}")
-                child_size = QStandardItem(f"{i*100} KB")
-                root_item.appendRow([child_item, child_size])
+            # Get the shared demo model
+            model = self._get_demo_model()
             
             # Create proxy model
             proxy_model = QSortFilterProxyModel()
-            proxy_model.setSourceModel(model)
+            proxy_model.setDynamicSortFilter(False)
+            # Nothing is attached to the proxy yet, so skip its layout signals
+            with QSignalBlocker(proxy_model):
+                proxy_model.setSourceModel(model)
             
-            # Set model on tree view
+            # Set model on tree view, then let the proxy track changes again
             tree_view.setModel(proxy_model)
+            proxy_model.setDynamicSortFilter(True)
+            
+            # Configure header once the model provides the columns
+            header = tree_view.header()
+            header.setSectionsMovable(False)
+            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+            header.resizeSection(0, 400)
+            header.resizeSection(1, 120)
             
             # Add tree view to layout
             browser_layout.addWidget(tree_view)
@@ -296,17 +380,22 @@ class GradualTestMainWindow(QMainWindow):
             self.status_label.setText("Complete simple file browser created successfully")
             logger.debug("Complete simple file browser created successfully")
         except Exception as e:
-            logger.error(f"Error creating complete file browser: {e}", exc_info=True)
+            logger.error("Error creating complete file browser: %s", e, exc_info=True)
             self.status_label.setText(f"Error: {e}")
     
+    @pyqtSlot()
     def try_import_real_model(self):
         """Try importing the real FileSystemModel from the source code"""
         logger.debug("Trying to import real FileSystemModel")
+        self.clear_test_container()
+        self._after_fbv_load(self._show_real_model)
+    
+    def _show_real_model(self):
+        """Report whether FileSystemModel could be taken from the loaded module"""
         try:
-            self.clear_test_container()
-            
-            # Try importing
-            from ui.file_browser_view import FileSystemModel
+            # Use the module imported in the background
+            module = self._get_fbv_module()
+            FileSystemModel = module.FileSystemModel
             
             # Create a status label to show result
             result_label = QLabel("Successfully imported FileSystemModel from ui.file_browser_view")
@@ -315,20 +404,32 @@ class GradualTestMainWindow(QMainWindow):
             self.status_label.setText("FileSystemModel imported successfully")
             logger.debug("FileSystemModel imported successfully")
         except Exception as e:
-            logger.error(f"Error importing FileSystemModel: {e}", exc_info=True)
+            # Format the traceback once for both the log and the label
+            import traceback
+            tb = traceback.format_exc()
+            logger.error("Error importing FileSystemModel: %s\n%s", e, tb)
             self.status_label.setText(f"Import error: {str(e)}")
-            error_label = QLabel(f"Import error: {str(e)}\n{traceback.format_exc()}")
+            error_label = QLabel(f"Import error: {str(e)}\n{tb}")
             error_label.setWordWrap(True)
             self.test_layout.addWidget(error_label)
     
+    @pyqtSlot()
     def try_create_real_view(self):
         """Try creating the real FileBrowserView from the source code"""
         logger.debug("Trying to create real FileBrowserView")
+        self.clear_test_container()
+        self.status_label.setText("Creating FileBrowserView...")
+        
+        # Construct the view on the next event loop pass so the status
+        # label repaints before the (potentially slow) constructor runs
+        QTimer.singleShot(0, lambda: self._after_fbv_load(self._create_real_view))
+    
+    def _create_real_view(self):
+        """Create the real FileBrowserView and add it to the test container"""
         try:
-            self.clear_test_container()
-            
-            # Try importing
-            from ui.file_browser_view import FileBrowserView
+            # Use the module imported in the background
+            module = self._get_fbv_module()
+            FileBrowserView = module.FileBrowserView
             
             # Try creating an instance
             file_browser_view = FileBrowserView()
@@ -339,11 +440,20 @@ class GradualTestMainWindow(QMainWindow):
             self.status_label.setText("FileBrowserView created successfully")
             logger.debug("FileBrowserView created successfully")
         except Exception as e:
-            logger.error(f"Error creating FileBrowserView: {e}", exc_info=True)
+            # Format the traceback once for both the log and the label
+            import traceback
+            tb = traceback.format_exc()
+            logger.error("Error creating FileBrowserView: %s\n%s", e, tb)
             self.status_label.setText(f"Creation error: {str(e)}")
-            error_label = QLabel(f"Creation error: {str(e)}\n{traceback.format_exc()}")
+            error_label = QLabel(f"Creation error: {str(e)}\n{tb}")
             error_label.setWordWrap(True)
             self.test_layout.addWidget(error_label)
+    
+    def closeEvent(self, event):
+        """Wait for the background import so its thread isn't destroyed while running"""
+        self._fbv_loader.quit()
+        self._fbv_loader.wait()
+        super().closeEvent(event)
 
 def main():
     # Create application
@@ -365,4 +475,4 @@ if __name__ == "__main__":
     try:
         sys.exit(main())
     except Exception as e:
-        logger.error(f"Unhandled exception: {e}", exc_info=True) 
\ No newline at end of file
+        logger.error("Unhandled exception: %s", e, exc_info=True) 
\ No newline at end of file
@@ -10,25 +10,67 @@ import sys
 import os
 import logging
 import argparse
-import time
 import traceback
+import importlib
+import queue
+import atexit
+from logging.handlers import QueueHandler, QueueListener
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QPushButton, QLabel, QMessageBox
-from PyQt6.QtCore import QSettings, QTimer
+from PyQt6.QtCore import Qt, QSettings, QTimer, QSignalBlocker
 
-# Configure logging first
+# Configure logging first; records are formatted on the calling thread and
+# written to the console and log file by a background listener thread
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(
+    _log_queue,
+    logging.StreamHandler(),
+    logging.FileHandler("gradual_init.log", mode="w"),
+    respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=logging.DEBUG,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("gradual_init.log", mode="w")
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger("GradualInit")
 
-# Add src directory to path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
+# Process handle for memory usage logging (None if psutil is unavailable)
+try:
+    import psutil
+    _PROCESS = psutil.Process(os.getpid())
+except ImportError:
+    _PROCESS = None
+
+# Make the src package importable from the project root, once
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Module that provides each class used by the initialization steps
+_CLASS_MODULES = {
+    'DiskScanner': 'src.core.scanner',
+    'DataAnalyzer': 'src.core.analyzer',
+    'DashboardView': 'src.ui.dashboard_view',
+    'FileBrowserView': 'src.ui.file_browser_view',
+    'DuplicatesView': 'src.ui.duplicates_view',
+    'FileTypesView': 'src.ui.file_types_view',
+    'RecommendationsView': 'src.ui.recommendations_view',
+}
+CORE_CLASSES = ('DiskScanner', 'DataAnalyzer')
+VIEW_CLASSES = ('DashboardView', 'FileBrowserView', 'DuplicatesView', 'FileTypesView', 'RecommendationsView')
+
+# Classes imported so far, by name
+_CLASSES = {}
+
+def _load_class(name):
+    """Import a class on first use and return the cached class afterwards"""
+    cls = _CLASSES.get(name)
+    if cls is None:
+        cls = getattr(importlib.import_module(_CLASS_MODULES[name]), name)
+        _CLASSES[name] = cls
+    return cls
 
 class GradualMainWindow(QMainWindow):
     """Main window that initializes components gradually"""
@@ -55,187 +97,213 @@ class GradualMainWindow(QMainWindow):
         self.add_init_button("4. Create UI Components", self._create_ui_components)
         self.add_init_button("5. Connect Signals", self._connect_signals)
         self.add_init_button("6. Initialize Views", self._initialize_views)
-        self.add_init_button("7. Test Signal Emissions", self._test_signals)
+        self._test_signals_button = self.add_init_button("7. Test Signal Emissions", self._test_signals)
+        
+        # Components created by the initialization steps
+        self.scanner = None
+        self.analyzer = None
+        self.tab_widget = None
+        self.dashboard_view = None
+        self.file_browser_view = None
+        self.duplicates_view = None
+        self.file_types_view = None
+        self.recommendations_view = None
+        self.progress_bar = None
+        self._tab_views = []
+        self._view_data = None
+        
+        # Names of the initialization steps that have completed; each step
+        # runs its prerequisites first and does nothing if already done
+        self._done = set()
+        
+        # Open error dialogs keyed on (message, details) -> [dialog, count]
+        self._error_boxes = {}
+        
+        # Progress updates are coalesced and applied at most every 33 ms
+        self._last_progress = (0, 0, '')
+        self._last_pct = -1
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
         
         logger.debug("Basic main window initialization complete")
     
     def add_init_button(self, text, callback):
-        """Add an initialization button to the layout"""
+        """Add an initialization button to the layout and return it"""
         button = QPushButton(text)
         button.clicked.connect(callback)
         self.layout.addWidget(button)
+        return button
     
     def _import_core_classes(self):
         """Import core classes"""
+        if 'core_classes' in self._done:
+            return True
         try:
             logger.debug("Importing core classes...")
             self.status_label.setText("Importing core classes...")
             
             # Import core modules
-            from src.core.scanner import DiskScanner
-            from src.core.analyzer import DataAnalyzer
+            for name in CORE_CLASSES:
+                _load_class(name)
             
             logger.debug("Core classes imported successfully")
             self.status_label.setText("Core classes imported successfully")
             self._log_memory_usage("After importing core classes")
+            self._done.add('core_classes')
             return True
         except Exception as e:
-            logger.error(f"Error importing core classes: {e}", exc_info=True)
+            details = traceback.format_exc()
+            logger.error("Error importing core classes: %s\n%s", e, details)
             self.status_label.setText(f"Error importing core classes: {str(e)}")
-            self._show_error(f"Error importing core classes: {str(e)}", traceback.format_exc())
+            self._show_error(f"Error importing core classes: {str(e)}", details)
             return False
     
     def _create_scanner_analyzer(self):
         """Create scanner and analyzer instances"""
+        if 'scanner_analyzer' in self._done:
+            return True
         try:
             logger.debug("Creating scanner and analyzer...")
             self.status_label.setText("Creating scanner and analyzer...")
             
-            # Import if not already imported
             if not self._import_core_classes():
                 return False
             
             # Create instances
-            from src.core.scanner import DiskScanner
-            from src.core.analyzer import DataAnalyzer
-            
-            self.scanner = DiskScanner()
-            self.analyzer = DataAnalyzer()
+            self.scanner = _load_class('DiskScanner')()
+            self.analyzer = _load_class('DataAnalyzer')()
             
             logger.debug("Scanner and analyzer created successfully")
             self.status_label.setText("Scanner and analyzer created successfully")
             self._log_memory_usage("After creating scanner and analyzer")
+            self._done.add('scanner_analyzer')
             return True
         except Exception as e:
-            logger.error(f"Error creating scanner and analyzer: {e}", exc_info=True)
+            details = traceback.format_exc()
+            logger.error("Error creating scanner and analyzer: %s\n%s", e, details)
             self.status_label.setText(f"Error creating scanner and analyzer: {str(e)}")
-            self._show_error(f"Error creating scanner and analyzer: {str(e)}", traceback.format_exc())
+            self._show_error(f"Error creating scanner and analyzer: {str(e)}", details)
             return False
     
     def _import_ui_views(self):
         """Import UI view classes"""
+        if 'ui_views' in self._done:
+            return True
         try:
             logger.debug("Importing UI views...")
             self.status_label.setText("Importing UI views...")
             
             # Import UI components one by one and log after each
-            
-            logger.debug("Importing DashboardView...")
-            from src.ui.dashboard_view import DashboardView
-            logger.debug("DashboardView imported")
-            self._log_memory_usage("After importing DashboardView")
-            
-            logger.debug("Importing FileBrowserView...")
-            from src.ui.file_browser_view import FileBrowserView
-            logger.debug("FileBrowserView imported")
-            self._log_memory_usage("After importing FileBrowserView")
-            
-            logger.debug("Importing DuplicatesView...")
-            from src.ui.duplicates_view import DuplicatesView
-            logger.debug("DuplicatesView imported")
-            self._log_memory_usage("After importing DuplicatesView")
-            
-            logger.debug("Importing FileTypesView...")
-            from src.ui.file_types_view import FileTypesView
-            logger.debug("FileTypesView imported")
-            self._log_memory_usage("After importing FileTypesView")
-            
-            logger.debug("Importing RecommendationsView...")
-            from src.ui.recommendations_view import RecommendationsView
-            logger.debug("RecommendationsView imported")
-            self._log_memory_usage("After importing RecommendationsView")
+            for name in VIEW_CLASSES:
+                logger.debug("Importing %s...", name)
+                _load_class(name)
+                logger.debug("%s imported", name)
+                self._log_memory_usage(f"After importing {name}")
             
             logger.debug("All UI views imported successfully")
             self.status_label.setText("All UI views imported successfully")
+            self._done.add('ui_views')
             return True
         except Exception as e:
-            logger.error(f"Error importing UI views: {e}", exc_info=True)
+            details = traceback.format_exc()
+            logger.error("Error importing UI views: %s\n%s", e, details)
             self.status_label.setText(f"Error importing UI views: {str(e)}")
-            self._show_error(f"Error importing UI views: {str(e)}", traceback.format_exc())
+            self._show_error(f"Error importing UI views: {str(e)}", details)
             return False
     
     def _create_ui_components(self):
         """Create UI components"""
+        if 'ui_components' in self._done:
+            return True
         try:
             logger.debug("Creating UI components...")
             self.status_label.setText("Creating UI components...")
             
-            # Import UI views if not already imported
             if not self._import_ui_views():
                 return False
             
-            # Create scanner and analyzer if not already created
-            if not hasattr(self, 'scanner') or not hasattr(self, 'analyzer'):
-                if not self._create_scanner_analyzer():
-                    return False
-            
-            # Import UI views
-            from src.ui.dashboard_view import DashboardView
-            from src.ui.file_browser_view import FileBrowserView
-            from src.ui.duplicates_view import DuplicatesView
-            from src.ui.file_types_view import FileTypesView
-            from src.ui.recommendations_view import RecommendationsView
+            if not self._create_scanner_analyzer():
+                return False
             
             # Create tab widget
             from PyQt6.QtWidgets import QTabWidget
             self.tab_widget = QTabWidget()
             
-            # Create views step by step with logging
-            logger.debug("Creating DashboardView...")
-            self.dashboard_view = DashboardView()
-            logger.debug("DashboardView created")
-            self._log_memory_usage("After creating DashboardView")
-            
-            logger.debug("Creating FileBrowserView...")
-            self.file_browser_view = FileBrowserView()
-            logger.debug("FileBrowserView created")
-            self._log_memory_usage("After creating FileBrowserView")
-            
-            logger.debug("Creating DuplicatesView...")
-            self.duplicates_view = DuplicatesView()
-            logger.debug("DuplicatesView created")
-            self._log_memory_usage("After creating DuplicatesView")
-            
-            logger.debug("Creating FileTypesView...")
-            self.file_types_view = FileTypesView()
-            logger.debug("FileTypesView created")
-            self._log_memory_usage("After creating FileTypesView")
-            
-            logger.debug("Creating RecommendationsView...")
-            self.recommendations_view = RecommendationsView()
-            logger.debug("RecommendationsView created")
-            self._log_memory_usage("After creating RecommendationsView")
-            
-            # Add tabs to tab widget
-            logger.debug("Adding views to tab widget...")
-            self.tab_widget.addTab(self.dashboard_view, "Dashboard")
-            self.tab_widget.addTab(self.file_browser_view, "Files & Folders")
-            self.tab_widget.addTab(self.duplicates_view, "Duplicates")
-            self.tab_widget.addTab(self.file_types_view, "File Types")
-            self.tab_widget.addTab(self.recommendations_view, "Recommendations")
+            # Views are only created when their tab is first shown; until then
+            # each tab holds an empty placeholder widget
+            self._tab_views = [
+                ("dashboard_view", "Dashboard", _load_class('DashboardView')),
+                ("file_browser_view", "Files & Folders", _load_class('FileBrowserView')),
+                ("duplicates_view", "Duplicates", _load_class('DuplicatesView')),
+                ("file_types_view", "File Types", _load_class('FileTypesView')),
+                ("recommendations_view", "Recommendations", _load_class('RecommendationsView')),
+            ]
+            logger.debug("Adding placeholder tabs to tab widget...")
+            for attr, title, view_class in self._tab_views:
+                setattr(self, attr, None)
+                self.tab_widget.addTab(QWidget(), title)
+            self.tab_widget.currentChanged.connect(self._materialize_tab)
+            
+            # Create the initially visible view
+            self._materialize_tab(self.tab_widget.currentIndex())
             
             # Add tab widget to layout
             self.layout.addWidget(self.tab_widget)
             
             logger.debug("UI components created successfully")
             self.status_label.setText("UI components created successfully")
+            self._done.add('ui_components')
             return True
         except Exception as e:
-            logger.error(f"Error creating UI components: {e}", exc_info=True)
+            details = traceback.format_exc()
+            logger.error("Error creating UI components: %s\n%s", e, details)
             self.status_label.setText(f"Error creating UI components: {str(e)}")
-            self._show_error(f"Error creating UI components: {str(e)}", traceback.format_exc())
+            self._show_error(f"Error creating UI components: {str(e)}", details)
             return False
     
+    def _materialize_tab(self, index):
+        """Create the real view for a tab the first time it is shown"""
+        if index < 0:
+            return
+        attr, title, view_class = self._tab_views[index]
+        if getattr(self, attr) is not None:
+            return
+        
+        try:
+            logger.debug("Creating %s...", view_class.__name__)
+            view = view_class()
+            setattr(self, attr, view)
+            self._log_memory_usage(f"After creating {view_class.__name__}")
+            
+            # Swap the placeholder for the real view without re-entering this slot
+            placeholder = self.tab_widget.widget(index)
+            with QSignalBlocker(self.tab_widget):
+                self.tab_widget.removeTab(index)
+                self.tab_widget.insertTab(index, view, title)
+                self.tab_widget.setCurrentIndex(index)
+            placeholder.deleteLater()
+            
+            # Bring the new view up to date if views were already initialized
+            if self._view_data is not None and hasattr(view, 'update_view'):
+                view.update_view(*self._view_data)
+        except Exception as e:
+            details = traceback.format_exc()
+            logger.error("Error creating %s: %s\n%s", view_class.__name__, e, details)
+            self.status_label.setText(f"Error creating {view_class.__name__}: {str(e)}")
+            self._show_error(f"Error creating {view_class.__name__}: {str(e)}", details)
+    
     def _connect_signals(self):
         """Connect scanner signals to handlers"""
+        if 'signals' in self._done:
+            return True
         try:
             logger.debug("Connecting signals...")
             self.status_label.setText("Connecting signals...")
             
-            # Create scanner and analyzer if not already created
-            if not hasattr(self, 'scanner') or not hasattr(self, 'analyzer'):
-                if not self._create_scanner_analyzer():
-                    return False
+            if not self._create_scanner_analyzer():
+                return False
             
             # Connect signals with correct parameter order
             logger.debug("Connecting scan_started signal...")
@@ -252,23 +320,25 @@ class GradualMainWindow(QMainWindow):
             
             logger.debug("Signals connected successfully")
             self.status_label.setText("Signals connected successfully")
+            self._done.add('signals')
             return True
         except Exception as e:
-            logger.error(f"Error connecting signals: {e}", exc_info=True)
+            details = traceback.format_exc()
+            logger.error("Error connecting signals: %s\n%s", e, details)
             self.status_label.setText(f"Error connecting signals: {str(e)}")
-            self._show_error(f"Error connecting signals: {str(e)}", traceback.format_exc())
+            self._show_error(f"Error connecting signals: {str(e)}", details)
             return False
     
     def _initialize_views(self):
         """Initialize views with stub data"""
+        if 'views' in self._done:
+            return True
         try:
             logger.debug("Initializing views...")
             self.status_label.setText("Initializing views...")
             
-            # Create UI components if not already created
-            if not hasattr(self, 'dashboard_view'):
-                if not self._create_ui_components():
-                    return False
+            if not self._create_ui_components():
+                return False
             
             # Create empty results dictionary
             mock_results = {
@@ -278,34 +348,25 @@ class GradualMainWindow(QMainWindow):
                 "root_info": None
             }
             
-            # Initialize views with mock data
-            logger.debug("Initializing DashboardView...")
-            if hasattr(self.dashboard_view, 'update_view'):
-                self.dashboard_view.update_view(mock_results, self.analyzer)
-            
-            logger.debug("Initializing FileBrowserView...")
-            if hasattr(self.file_browser_view, 'update_view'):
-                self.file_browser_view.update_view(mock_results, self.analyzer)
-            
-            logger.debug("Initializing DuplicatesView...")
-            if hasattr(self.duplicates_view, 'update_view'):
-                self.duplicates_view.update_view(mock_results, self.analyzer)
+            # Keep the data so views created later are initialized as well
+            self._view_data = (mock_results, self.analyzer)
             
-            logger.debug("Initializing FileTypesView...")
-            if hasattr(self.file_types_view, 'update_view'):
-                self.file_types_view.update_view(mock_results, self.analyzer)
-            
-            logger.debug("Initializing RecommendationsView...")
-            if hasattr(self.recommendations_view, 'update_view'):
-                self.recommendations_view.update_view(mock_results, self.analyzer)
+            # Initialize the views created so far with mock data
+            for attr, title, view_class in self._tab_views:
+                view = getattr(self, attr)
+                if view is not None and hasattr(view, 'update_view'):
+                    logger.debug("Initializing %s...", view_class.__name__)
+                    view.update_view(mock_results, self.analyzer)
             
             logger.debug("Views initialized successfully")
             self.status_label.setText("Views initialized successfully")
+            self._done.add('views')
             return True
         except Exception as e:
-            logger.error(f"Error initializing views: {e}", exc_info=True)
+            details = traceback.format_exc()
+            logger.error("Error initializing views: %s\n%s", e, details)
             self.status_label.setText(f"Error initializing views: {str(e)}")
-            self._show_error(f"Error initializing views: {str(e)}", traceback.format_exc())
+            self._show_error(f"Error initializing views: {str(e)}", details)
             return False
     
     def _test_signals(self):
@@ -314,12 +375,11 @@ class GradualMainWindow(QMainWindow):
             logger.debug("Testing signal emissions...")
             self.status_label.setText("Testing signal emissions...")
             
-            # Connect signals if not already connected
             if not self._connect_signals():
                 return False
             
             # Create progress bar if it doesn't exist
-            if not hasattr(self, 'progress_bar'):
+            if self.progress_bar is None:
                 from PyQt6.QtWidgets import QProgressBar
                 self.progress_bar = QProgressBar()
                 self.layout.addWidget(self.progress_bar)
@@ -331,13 +391,27 @@ class GradualMainWindow(QMainWindow):
             logger.debug("Emitting scan_started signal...")
             self.scanner.scan_started.emit("/test/path")
             
-            # Emit scan_progress signals
+            # Emit scan_progress signals from the event loop, one every 200 ms;
+            # no new run can start until this one finishes
             logger.debug("Emitting scan_progress signals...")
-            for i in range(0, 101, 20):
-                logger.debug(f"Emitting progress {i}%...")
+            self._test_signals_button.setEnabled(False)
+            self._emit_test_progress(0)
+            return True
+        except Exception as e:
+            details = traceback.format_exc()
+            logger.error("Error testing signal emissions: %s\n%s", e, details)
+            self.status_label.setText(f"Error testing signal emissions: {str(e)}")
+            self._show_error(f"Error testing signal emissions: {str(e)}", details)
+            return False
+    
+    def _emit_test_progress(self, i):
+        """Emit one test progress signal and schedule the next, then finish"""
+        try:
+            if i <= 100:
+                logger.debug("Emitting progress %d%%...", i)
                 self.scanner.scan_progress.emit(i, 100, f"/test/path/file_{i}.txt")
-                QApplication.processEvents()  # Process events to update UI
-                time.sleep(0.2)  # Short delay to see progress
+                QTimer.singleShot(200, lambda: self._emit_test_progress(i + 20))
+                return
             
             # Emit scan_finished signal
             logger.debug("Emitting scan_finished signal...")
@@ -351,82 +425,102 @@ class GradualMainWindow(QMainWindow):
             
             logger.debug("Signal emissions tested successfully")
             self.status_label.setText("Signal emissions tested successfully")
-            return True
+            self._test_signals_button.setEnabled(True)
         except Exception as e:
-            logger.error(f"Error testing signal emissions: {e}", exc_info=True)
+            self._test_signals_button.setEnabled(True)
+            details = traceback.format_exc()
+            logger.error("Error testing signal emissions: %s\n%s", e, details)
             self.status_label.setText(f"Error testing signal emissions: {str(e)}")
-            self._show_error(f"Error testing signal emissions: {str(e)}", traceback.format_exc())
-            return False
+            self._show_error(f"Error testing signal emissions: {str(e)}", details)
     
     def _on_scan_started(self, path):
         """Handle scan started signal"""
-        logger.debug(f"_on_scan_started called with path={path}")
+        logger.debug("_on_scan_started called with path=%s", path)
         self.status_label.setText(f"Scan started: {path}")
         
         # Show progress bar if it exists
-        if hasattr(self, 'progress_bar'):
+        if self.progress_bar is not None:
             self.progress_bar.setValue(0)
+            self._last_pct = 0
             self.progress_bar.setVisible(True)
     
     def _on_scan_progress(self, current, total, current_path):
         """Handle scan progress signal with CORRECT parameter order"""
-        logger.debug(f"_on_scan_progress called with current={current}, total={total}, current_path={current_path}")
+        logger.debug("_on_scan_progress called with current=%s, total=%s, current_path=%s",
+                     current, total, current_path)
         
+        # Only keep the latest values; the progress timer applies them
+        self._last_progress = (current, total, current_path)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _flush_progress(self):
+        """Apply the most recent scan progress to the UI"""
+        current, total, current_path = self._last_progress
         try:
-            # Convert parameters to integers if they're strings
-            if isinstance(total, str):
-                total = int(total)
-            if isinstance(current, str):
-                current = int(current)
-            
-            # Update progress bar if it exists
-            if hasattr(self, 'progress_bar') and total > 0:
-                percent = int((current / total) * 100)
-                self.progress_bar.setValue(percent)
+            # scan_progress is declared (int, int, str), so no coercion is needed
+            if self.progress_bar is not None and total > 0:
+                percent = (current * 100) // total
+                if percent != self._last_pct:
+                    self.progress_bar.setValue(percent)
+                    self._last_pct = percent
             
             self.status_label.setText(f"Scanning: {current_path}")
         except Exception as e:
-            logger.error(f"Error in scan progress handler: {e}", exc_info=True)
+            logger.error("Error in scan progress handler: %s", e, exc_info=True)
             # Don't crash on progress updates
     
     def _on_scan_finished(self, results):
         """Handle scan finished signal"""
-        logger.debug(f"_on_scan_finished called with results of type {type(results)}")
+        logger.debug("_on_scan_finished called with results of type %s", type(results))
+        self._progress_timer.stop()
         self.status_label.setText("Scan completed")
         
         # Hide progress bar if it exists
-        if hasattr(self, 'progress_bar'):
+        if self.progress_bar is not None:
             self.progress_bar.setVisible(False)
     
     def _on_scan_error(self, error_message):
         """Handle scan error signal"""
-        logger.debug(f"_on_scan_error called with error_message={error_message}")
+        logger.debug("_on_scan_error called with error_message=%s", error_message)
+        self._progress_timer.stop()
         self.status_label.setText(f"Error: {error_message}")
         
         # Hide progress bar if it exists
-        if hasattr(self, 'progress_bar'):
+        if self.progress_bar is not None:
             self.progress_bar.setVisible(False)
     
     def _show_error(self, message, details):
         """Show error dialog with detailed information"""
-        error_box = QMessageBox()
+        # Repeats of an error that is still on screen only bump its counter
+        key = (message, details)
+        shown = self._error_boxes.get(key)
+        if shown is not None:
+            shown[1] += 1
+            shown[0].setWindowTitle(f"Error (x{shown[1]})")
+            return
+        
+        error_box = QMessageBox(self)
+        error_box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         error_box.setIcon(QMessageBox.Icon.Critical)
         error_box.setWindowTitle("Error")
         error_box.setText(message)
         error_box.setDetailedText(details)
-        error_box.exec()
+        error_box.finished.connect(lambda _result: self._error_boxes.pop(key, None))
+        self._error_boxes[key] = [error_box, 1]
+        
+        # Don't block the event loop while the dialog is up
+        error_box.open()
     
     def _log_memory_usage(self, description):
         """Log memory usage for debugging"""
+        if _PROCESS is None or not logger.isEnabledFor(logging.DEBUG):
+            return
         try:
-            import psutil
-            process = psutil.Process(os.getpid())
-            memory_info = process.memory_info()
-            logger.debug(f"Memory usage ({description}): {memory_info.rss / 1024 / 1024:.2f} MB")
-        except ImportError:
-            logger.debug(f"Memory usage logging skipped - psutil not available")
+            memory_info = _PROCESS.memory_info()
+            logger.debug("Memory usage (%s): %.2f MB", description, memory_info.rss / 1024 / 1024)
         except Exception as e:
-            logger.debug(f"Error logging memory usage: {e}")
+            logger.debug("Error logging memory usage: %s", e)
 
 def main():
     """Application entry point"""
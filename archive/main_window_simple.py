@@ -13,15 +13,16 @@ import logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("MainWindowSimple")
 
-# Add src directory to path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
+# Make the src package importable from the project root, once
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget, QPushButton, QLabel, 
     QStatusBar, QProgressBar
 )
-from PyQt6.QtCore import pyqtSignal, QObject
+from PyQt6.QtCore import pyqtSignal, QObject, QTimer
 
 # Import just the scanner class, not the whole MainWindow
 from src.core.scanner import DiskScanner
@@ -42,6 +43,14 @@ class SimplifiedMainWindow(QMainWindow):
         # Create UI components
         self._create_ui()
         
+        # Progress updates are coalesced and applied at most every 33 ms
+        self._last_progress = (0, 0, '')
+        self._last_pct = -1
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
         # Connect signals - NOTE: Connect them after UI is created
         logger.debug("Connecting scanner signals")
         self.scanner.scan_started.connect(self._on_scan_started)
@@ -101,54 +110,72 @@ class SimplifiedMainWindow(QMainWindow):
                 "scan_time": 1.5
             })
             
+            # Coalesced progress must be flushed, not dropped, when the scan ends
+            if self.progress_bar.value() != 100:
+                logger.error("Final progress was dropped: bar shows %d%%",
+                             self.progress_bar.value())
+            
             logger.debug("All signals emitted successfully")
             
         except Exception as e:
-            logger.error(f"Error testing signals: {e}", exc_info=True)
+            logger.error("Error testing signals: %s", e, exc_info=True)
             self.status_bar.showMessage(f"Error: {str(e)}")
     
     def _on_scan_started(self, path):
         """Handle scan started signal"""
-        logger.debug(f"_on_scan_started called with path={path}")
+        logger.debug("_on_scan_started called with path=%s", path)
         self.status_bar.showMessage(f"Scanning {path}...")
         self.progress_bar.setValue(0)
+        self._last_pct = 0
         self.progress_bar.setVisible(True)
     
     def _on_scan_progress(self, current, total, current_path):
         """Handle scan progress signal"""
-        logger.debug(f"_on_scan_progress: current={current}({type(current)}), " 
-                   f"total={total}({type(total)}), current_path={current_path}({type(current_path)})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("_on_scan_progress: current=%s(%s), total=%s(%s), current_path=%s(%s)",
+                         current, type(current), total, type(total),
+                         current_path, type(current_path))
         
+        # Only keep the latest values; the progress timer applies them
+        self._last_progress = (current, total, current_path)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+    
+    def _flush_progress(self):
+        """Apply the most recent scan progress to the UI"""
+        current, total, current_path = self._last_progress
         try:
-            # Convert parameters to integers if they're strings
-            if isinstance(total, str):
-                logger.debug(f"Converting total '{total}' to int")
-                total = int(total)
-            if isinstance(current, str):
-                logger.debug(f"Converting current '{current}' to int")
-                current = int(current)
-            
-            # Calculate percentage
+            # scan_progress is declared (int, int, str), so no coercion is needed
             if total > 0:
-                percent = int((current / total) * 100)
-                logger.debug(f"Progress percentage: {percent}%")
-                self.progress_bar.setValue(percent)
+                percent = (current * 100) // total
+                if percent != self._last_pct:
+                    logger.debug("Progress percentage: %d%%", percent)
+                    self.progress_bar.setValue(percent)
+                    self._last_pct = percent
             
             self.status_bar.showMessage(f"Scanning: {current_path}")
             
         except Exception as e:
-            logger.error(f"Error in scan progress handler: {e}", exc_info=True)
+            logger.error("Error in scan progress handler: %s", e, exc_info=True)
             # Don't crash on progress updates
     
+    def _stop_progress_timer(self):
+        """Stop the progress timer, applying any update it was still holding"""
+        if self._progress_timer.isActive():
+            self._progress_timer.stop()
+            self._flush_progress()
+    
     def _on_scan_finished(self, results):
         """Handle scan finished signal"""
-        logger.debug(f"_on_scan_finished called with results={type(results)}")
+        logger.debug("_on_scan_finished called with results=%s", type(results))
+        self._stop_progress_timer()
         self.status_bar.showMessage("Scan completed")
         self.progress_bar.setVisible(False)
     
     def _on_scan_error(self, error_message):
         """Handle scan error signal"""
-        logger.debug(f"_on_scan_error called with error_message={error_message}")
+        logger.debug("_on_scan_error called with error_message=%s", error_message)
+        self._stop_progress_timer()
         self.status_bar.showMessage(f"Error: {error_message}")
         self.progress_bar.setVisible(False)
 
@@ -163,4 +190,4 @@ if __name__ == "__main__":
     try:
         sys.exit(main())
     except Exception as e:
-        logger.error(f"Unhandled exception: {e}", exc_info=True) 
\ No newline at end of file
+        logger.error("Unhandled exception: %s", e, exc_info=True) 
\ No newline at end of file
@@ -6,13 +6,51 @@ Mock classes for testing
 
 from PyQt6.QtCore import QTimer
 
+# Static data returned by MockAnalyzer, built once at import; the getters
+# hand out fresh dicts so callers can't modify it
+_LARGEST_FILES = tuple(
+    {
+        "path": f"/mock/path/to/large_file_{i}.dat",
+        "size": 1000000 // i,
+        "mtime": 1648000000 + i*1000
+    }
+    for i in range(1, 10)
+)
+_LARGEST_DIRS = tuple(
+    {
+        "path": f"/mock/path/to/dir_{i}",
+        "size": 1000000 // i,
+        "files": 50 // i
+    }
+    for i in range(1, 10)
+)
+_FILE_TYPE_BREAKDOWN = {
+    "text": {"size": 200000, "count": 30},
+    "image": {"size": 300000, "count": 20},
+    "document": {"size": 150000, "count": 15},
+    "video": {"size": 250000, "count": 5},
+    "other": {"size": 100000, "count": 30}
+}
+_DUPLICATES = {
+    f"mock_hash_{i}": [
+        {
+            "path": f"/mock/path/to/duplicate_{i}_{j}.dat",
+            "size": 100000 * i,
+            "mtime": 1648000000 + j*1000
+        }
+        for j in range(1, i+2)
+    ]
+    for i in range(1, 5)
+}
+
 class MockSignal:
     """Mock PyQt signal"""
     def __init__(self):
-        self.callbacks = []
+        # Rebuilt on connect so emit always iterates an immutable snapshot
+        self.callbacks = ()
     
     def connect(self, callback):
-        self.callbacks.append(callback)
+        self.callbacks = self.callbacks + (callback,)
     
     def emit(self, *args):
         for callback in self.callbacks:
@@ -26,27 +64,57 @@ class MockScanner:
         self.scan_finished = MockSignal()
         self.scan_error = MockSignal()
         self._stop_requested = False
+        
+        # Bumped by every scan; a step chain from an older scan stops itself
+        self._generation = 0
+        self._running = False
     
     def configure(self, config):
         pass
     
-    def scan(self, directory, resume=False):
-        # Simulate immediate completion for testing
-        self.scan_started.emit(directory)
+    def scan(self, directory, resume=False, synchronous=True):
+        """
+        Emit the whole mock scan before returning. With synchronous=False one
+        step runs per event loop pass instead, so a stop request can end the
+        scan early.
+        """
+        # A scan still in progress is replaced; report it as cancelled
+        if self._running:
+            self.scan_finished.emit(None)
+        self._generation += 1
+        generation = self._generation
+        self._running = True
         
-        # Simulate progress updates
+        self._stop_requested = False
         self._progress_value = 0
         self._total_value = 100
         self._directory = directory
-        self._timer = QTimer()
-        self._timer.timeout.connect(self._update_progress)
-        self._timer.start(100)  # Update every 100ms
+        self._path_prefix = directory + "/file_"
+        self.scan_started.emit(directory)
+        
+        if synchronous:
+            # A slot may start another scan, which takes over from this one
+            while generation == self._generation and self._step():
+                pass
+        else:
+            self._step_later(generation)
     
-    def _update_progress(self):
-        """Update progress"""
+    def _step_later(self, generation):
+        """Schedule the next step of a scan generation with no delay"""
+        QTimer.singleShot(0, lambda: self._deferred_step(generation))
+    
+    def _deferred_step(self, generation):
+        if generation == self._generation and self._step():
+            self._step_later(generation)
+    
+    def _step(self):
+        """
+        Emit the next progress update, or scan_finished once the scan is
+        complete or stopped. Returns whether more steps follow.
+        """
         self._progress_value += 5
         if self._progress_value >= self._total_value or self._stop_requested:
-            self._timer.stop()
+            self._running = False
             if self._stop_requested:
                 self.scan_finished.emit(None)
             else:
@@ -58,9 +126,13 @@ class MockScanner:
                     "scan_time": 5.0
                 }
                 self.scan_finished.emit(result)
-        else:
-            mock_path = f"{self._directory}/file_{self._progress_value}.txt"
+            return False
+        
+        # Mock paths are only built when something listens for progress
+        if self.scan_progress.callbacks:
+            mock_path = self._path_prefix + str(self._progress_value) + ".txt"
             self.scan_progress.emit(self._progress_value, self._total_value, mock_path)
+        return True
     
     def has_partial_scan(self, path):
         return None
@@ -75,47 +147,19 @@ class MockAnalyzer:
     
     def get_largest_files(self, results, limit=50):
         # Return some mock files
-        mock_files = []
-        for i in range(1, min(limit+1, 10)):
-            mock_files.append({
-                "path": f"/mock/path/to/large_file_{i}.dat",
-                "size": 1000000 // i,
-                "mtime": 1648000000 + i*1000
-            })
-        return mock_files
+        return [dict(file_info) for file_info in _LARGEST_FILES[:limit]]
     
     def get_largest_directories(self, results, limit=50):
         # Return some mock directories
-        mock_dirs = []
-        for i in range(1, min(limit+1, 10)):
-            mock_dirs.append({
-                "path": f"/mock/path/to/dir_{i}",
-                "size": 1000000 // i,
-                "files": 50 // i
-            })
-        return mock_dirs
+        return [dict(dir_info) for dir_info in _LARGEST_DIRS[:limit]]
     
     def get_file_type_breakdown(self, results):
         # Return mock file type breakdown
-        return {
-            "text": {"size": 200000, "count": 30},
-            "image": {"size": 300000, "count": 20},
-            "document": {"size": 150000, "count": 15},
-            "video": {"size": 250000, "count": 5},
-            "other": {"size": 100000, "count": 30}
-        }
+        return {file_type: dict(stats) for file_type, stats in _FILE_TYPE_BREAKDOWN.items()}
     
     def get_duplicate_files(self, results):
         # Return mock duplicates
-        mock_duplicates = {}
-        for i in range(1, 5):
-            hash_key = f"mock_hash_{i}"
-            files = []
-            for j in range(1, i+2):
-                files.append({
-                    "path": f"/mock/path/to/duplicate_{i}_{j}.dat",
-                    "size": 100000 * i,
-                    "mtime": 1648000000 + j*1000
-                })
-            mock_duplicates[hash_key] = files
-        return mock_duplicates 
\ No newline at end of file
+        return {
+            file_hash: [dict(file_info) for file_info in files]
+            for file_hash, files in _DUPLICATES.items()
+        }
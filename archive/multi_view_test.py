@@ -16,30 +16,29 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 
-# Add src directory to path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
-
-# Import core modules
-from src.core.scanner import DiskScanner
-from src.core.analyzer import DataAnalyzer
-
-# Import UI components
-from src.ui.dashboard_view import DashboardView
-from src.ui.file_types_view import FileTypesView
-from src.ui.file_browser_view import FileBrowserView
+# Make the src package importable
+from _test_common import ProgressThrottle, add_project_root
+add_project_root()
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("MultiViewTest")
 
+# Minimum interval between progress bar/status bar updates, in seconds
+PROGRESS_UPDATE_INTERVAL = 0.05
+
 class ComprehensiveMainWindow(QMainWindow):
+    # Posted (queued) to apply the latest pending status bar message
+    _status_update = pyqtSignal()
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Comprehensive Main Window Test")
         self.resize(900, 700)
         
-        # Create scanner and analyzer
+        # Create scanner and analyzer; core modules are imported on first use
+        from src.core.scanner import DiskScanner
+        from src.core.analyzer import DataAnalyzer
         self.scanner = DiskScanner()
         self.analyzer = DataAnalyzer()
         
@@ -54,6 +53,12 @@ class ComprehensiveMainWindow(QMainWindow):
         
         # Initialize scan results
         self.scan_results = None
+        
+        self._progress_throttle = ProgressThrottle(PROGRESS_UPDATE_INTERVAL)
+        
+        # Latest status message not yet shown; only one update is queued at a time
+        self._pending_status = None
+        self._status_update.connect(self._flush_status, Qt.ConnectionType.QueuedConnection)
     
     def _setup_ui(self):
         """Set up the user interface"""
@@ -71,7 +76,11 @@ class ComprehensiveMainWindow(QMainWindow):
         # Create tab widget
         self.tab_widget = QTabWidget()
         
-        # Create and add views
+        # Create and add views; UI modules are imported on first use
+        from src.ui.dashboard_view import DashboardView
+        from src.ui.file_types_view import FileTypesView
+        from src.ui.file_browser_view import FileBrowserView
+        
         self.dashboard_view = DashboardView()
         self.dashboard_view.scan_requested.connect(self.select_directory)
         
@@ -141,18 +150,35 @@ class ComprehensiveMainWindow(QMainWindow):
     
     def _on_scan_progress(self, current, total, current_path):
         """Handle scan progress signal"""
+        if not self._progress_throttle.ready(current, total):
+            return
+        
         try:
             if total > 0:
-                percent = int((current / total) * 100)
+                percent = (current * 100) // total
                 self.progress_bar.setValue(percent)
-            self.status_bar.showMessage(f"Scanning: {current_path}")
+            self._post_status(f"Scanning: {current_path}")
         except Exception as e:
             logger.error(f"Error in scan progress handler: {e}")
             # Don't crash on progress updates
     
+    def _post_status(self, message):
+        """Show a status message on the next event loop pass, dropping older ones"""
+        queued = self._pending_status is not None
+        self._pending_status = message
+        if not queued:
+            self._status_update.emit()
+    
+    def _flush_status(self):
+        """Show the latest pending status message"""
+        message, self._pending_status = self._pending_status, None
+        if message is not None:
+            self.status_bar.showMessage(message)
+    
     def _on_scan_completed(self, results):
         """Handle scan completed signal"""
         logger.info("Scan completed")
+        self._pending_status = None
         self.status_bar.showMessage("Scan completed")
         self.progress_bar.setVisible(False)
         
@@ -173,6 +199,7 @@ class ComprehensiveMainWindow(QMainWindow):
     def _on_scan_error(self, error_message):
         """Handle scan error signal"""
         logger.error(f"Scan error: {error_message}")
+        self._pending_status = None
         self.status_bar.showMessage(f"Error: {error_message}")
         self.progress_bar.setVisible(False)
         
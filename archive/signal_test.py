@@ -104,17 +104,9 @@ class TestWindow(QMainWindow):
         try:
             logger.info(f"_on_scan_progress called with: current={current} ({type(current)}), total={total} ({type(total)}), current_path={current_path} ({type(current_path)})")
             
-            # Convert parameters to integers if they're strings - same as in main_window.py
-            if isinstance(total, str):
-                logger.info(f"Converting total from string to int: {total}")
-                total = int(total)
-            if isinstance(current, str):
-                logger.info(f"Converting current from string to int: {current}")
-                current = int(current)
-            
-            # Calculate percentage
+            # scan_progress is declared (int, int, str), so no coercion is needed
             if total > 0:
-                percent = int((current / total) * 100)
+                percent = (current * 100) // total
                 logger.info(f"Calculated percent: {percent}%")
             
             self.status_label.setText(f"Progress: {current}/{total} - {current_path}")
@@ -27,6 +27,8 @@ logger.setLevel(logging.DEBUG)
 src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
 sys.path.insert(0, src_dir)
 
+from PyQt6.QtCore import Qt
+
 # Import the main window class
 from src.ui.main_window import MainWindow
 from src.core.scanner import DiskScanner
@@ -35,38 +37,32 @@ from src.core.scanner import DiskScanner
 class DebugDiskScanner(DiskScanner):
     def __init__(self, max_threads=4):
         super().__init__(max_threads)
-        # Save original emit methods
-        self._original_scan_started_emit = self.scan_started.emit
-        self._original_scan_progress_emit = self.scan_progress.emit
-        self._original_scan_finished_emit = self.scan_finished.emit
-        self._original_scan_error_emit = self.scan_error.emit
-        
-        # Override emit methods with debug versions
-        def debug_scan_started_emit(path):
-            logger.debug(f"Emitting scan_started({path}) with type {type(path)}")
-            return self._original_scan_started_emit(path)
-            
-        def debug_scan_progress_emit(current, total, current_path):
-            logger.debug(f"Emitting scan_progress({current}, {total}, {current_path}) with types {type(current)}, {type(total)}, {type(current_path)}")
-            return self._original_scan_progress_emit(current, total, current_path)
-            
-        def debug_scan_finished_emit(results):
-            logger.debug(f"Emitting scan_finished(results) with type {type(results)}")
-            return self._original_scan_finished_emit(results)
-            
-        def debug_scan_error_emit(error_message):
-            logger.debug(f"Emitting scan_error({error_message}) with type {type(error_message)}")
-            return self._original_scan_error_emit(error_message)
-        
-        # Apply debug methods
-        self.scan_started.emit = debug_scan_started_emit
-        self.scan_progress.emit = debug_scan_progress_emit
-        self.scan_finished.emit = debug_scan_finished_emit
-        self.scan_error.emit = debug_scan_error_emit
+        # Log emissions through directly connected slots rather than wrapping
+        # emit(), so nothing extra runs per signal unless DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            direct = Qt.ConnectionType.DirectConnection
+            self.scan_started.connect(self._log_scan_started, direct)
+            self.scan_progress.connect(self._log_scan_progress, direct)
+            self.scan_finished.connect(self._log_scan_finished, direct)
+            self.scan_error.connect(self._log_scan_error, direct)
+    
+    def _log_scan_started(self, path):
+        logger.debug("Emitting scan_started(%s) with type %s", path, type(path))
+    
+    def _log_scan_progress(self, current, total, current_path):
+        logger.debug("Emitting scan_progress(%s, %s, %s) with types %s, %s, %s",
+                     current, total, current_path, type(current), type(total), type(current_path))
+    
+    def _log_scan_finished(self, results):
+        logger.debug("Emitting scan_finished(results) with type %s", type(results))
+    
+    def _log_scan_error(self, error_message):
+        logger.debug("Emitting scan_error(%s) with type %s", error_message, type(error_message))
     
     def scan(self, path, is_blocking=False, resume=False):
         """Override scan method to add logging"""
-        logger.debug(f"DebugDiskScanner.scan called with path={path}, is_blocking={is_blocking}, resume={resume}")
+        logger.debug("DebugDiskScanner.scan called with path=%s, is_blocking=%s, resume=%s",
+                     path, is_blocking, resume)
         return super().scan(path, is_blocking, resume)
 
 # Subclass MainWindow to add logging
@@ -88,38 +84,42 @@ class DebugMainWindow(MainWindow):
     
     def _debug_on_scan_started(self, path):
         """Wrapper for _on_scan_started with logging"""
-        logger.debug(f"_on_scan_started called with path={path} of type {type(path)}")
+        logger.debug("_on_scan_started called with path=%s of type %s", path, type(path).__name__)
         try:
             return self._on_scan_started(path)
         except Exception as e:
-            logger.error(f"Exception in _on_scan_started: {e}", exc_info=True)
+            logger.error("Exception in _on_scan_started: %s", e, exc_info=True)
             raise
     
     def _debug_on_scan_progress(self, current, total, current_path):
         """Wrapper for _on_scan_progress with logging"""
-        logger.debug(f"_on_scan_progress called with current={current}({type(current)}), total={total}({type(total)}), current_path={current_path}({type(current_path)})")
+        # Called once per scanned file, so skip the type() calls unless needed
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("_on_scan_progress called with current=%s(%s), total=%s(%s), current_path=%s(%s)",
+                         current, type(current).__name__, total, type(total).__name__,
+                         current_path, type(current_path).__name__)
         try:
             return self._on_scan_progress(current, total, current_path)
         except Exception as e:
-            logger.error(f"Exception in _on_scan_progress: {e}", exc_info=True)
+            logger.error("Exception in _on_scan_progress: %s", e, exc_info=True)
             raise
     
     def _debug_on_scan_finished(self, results):
         """Wrapper for _on_scan_finished with logging"""
-        logger.debug(f"_on_scan_finished called with results of type {type(results)}")
+        logger.debug("_on_scan_finished called with results of type %s", type(results).__name__)
         try:
             return self._on_scan_finished(results)
         except Exception as e:
-            logger.error(f"Exception in _on_scan_finished: {e}", exc_info=True)
+            logger.error("Exception in _on_scan_finished: %s", e, exc_info=True)
             raise
     
     def _debug_on_scan_error(self, error_message):
         """Wrapper for _on_scan_error with logging"""
-        logger.debug(f"_on_scan_error called with error_message={error_message} of type {type(error_message)}")
+        logger.debug("_on_scan_error called with error_message=%s of type %s", error_message, type(error_message).__name__)
         try:
             return self._on_scan_error(error_message)
         except Exception as e:
-            logger.error(f"Exception in _on_scan_error: {e}", exc_info=True)
+            logger.error("Exception in _on_scan_error: %s", e, exc_info=True)
             raise
 
 def main():
@@ -128,13 +128,13 @@ def main():
     
     # Print system information
     import platform
-    logger.info(f"Python version: {platform.python_version()}")
-    logger.info(f"Platform: {platform.platform()}")
+    logger.info("Python version: %s", platform.python_version())
+    logger.info("Platform: %s", platform.platform())
     
     # Import PyQt6 modules
     from PyQt6.QtWidgets import QApplication
     from PyQt6.QtCore import QT_VERSION_STR
-    logger.info(f"Qt version: {QT_VERSION_STR}")
+    logger.info("Qt version: %s", QT_VERSION_STR)
     
     # Create Qt application
     app = QApplication(sys.argv)
@@ -161,4 +161,4 @@ if __name__ == "__main__":
     try:
         sys.exit(main())
     except Exception as e:
-        logger.critical(f"Fatal error: {e}", exc_info=True) 
\ No newline at end of file
+        logger.critical("Fatal error: %s", e, exc_info=True) 
\ No newline at end of file
@@ -13,48 +13,126 @@ import logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger("SimpleFileBrowser")
 
-# Add src directory to path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
+# Make the src package importable from the project root, once
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, 
     QTreeView, QHeaderView, QComboBox, QLineEdit, QToolBar
 )
-from PyQt6.QtCore import Qt, QSortFilterProxyModel, pyqtSignal
-from PyQt6.QtGui import QStandardItemModel, QStandardItem
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex, pyqtSignal
+
+from src.utils.helpers import human_readable_size
 
 # Create a simplified FileSystemModel without icon loading
-class SimpleFileSystemModel(QStandardItemModel):
-    """Simplified model for displaying file system data"""
+class SimpleFileSystemModel(QAbstractItemModel):
+    """
+    Simplified model for displaying file system data. Nodes are numbered and
+    stored as parallel name, size and parent lists; each index points at the
+    list of its siblings' node numbers.
+    """
+    
+    HEADERS = ("Name", "Size")
+    
+    # Parent number of top-level nodes
+    NO_PARENT = -1
     
     def __init__(self, parent=None):
         logger.debug("Initializing SimpleFileSystemModel")
-        super().__init__(0, 2, parent)  # Just name and size columns
-        
-        # Set headers
-        self.setHeaderData(0, Qt.Orientation.Horizontal, "Name")
-        self.setHeaderData(1, Qt.Orientation.Horizontal, "Size")
-        
-        # Set root item with test data
-        root_item = QStandardItem("Root")
-        size_item = QStandardItem("0 B")
+        super().__init__(parent)
         
-        # Make items not editable
-        root_item.setEditable(False)
-        size_item.setEditable(False)
+        self._names = []
+        self._sizes = []
+        self._parents = []
         
-        self.appendRow([root_item, size_item])
+        # Node number -> child node numbers in display order, and each node's
+        # row among its siblings
+        self._children = {self.NO_PARENT: []}
+        self._rows = []
         
-        # Add some children
+        # Set root item with test data and add some children, sizes in bytes
+        root = self._add_node("Root", 0)
         for i in range(5):
-            child_item = QStandardItem(f"Item {i}")
-            child_size = QStandardItem(f"{i*100} KB")
-            child_item.setEditable(False)
-            child_size.setEditable(False)
-            root_item.appendRow([child_item, child_size])
+            self._add_node(f"Item {i}", i * 100 * 1024, root)
         
         logger.debug("SimpleFileSystemModel initialized")
+    
+    def _add_node(self, name, size, parent=NO_PARENT):
+        """Append a node under parent and return its number"""
+        node = len(self._names)
+        self._names.append(name)
+        self._sizes.append(size)
+        self._parents.append(parent)
+        self._children[node] = []
+        
+        siblings = self._children[parent]
+        self._rows.append(len(siblings))
+        siblings.append(node)
+        return node
+    
+    def _node(self, index):
+        """Node number shown at a valid index"""
+        return index.internalPointer()[index.row()]
+    
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        node = self._node(parent) if parent.isValid() else self.NO_PARENT
+        return self.createIndex(row, column, self._children[node])
+    
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = self._parents[self._node(index)]
+        if parent == self.NO_PARENT:
+            return QModelIndex()
+        grandparent = self._parents[parent]
+        return self.createIndex(self._rows[parent], 0, self._children[grandparent])
+    
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._children[self.NO_PARENT])
+        if parent.column() != 0:
+            return 0
+        return len(self._children[self._node(parent)])
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        node = self._node(index)
+        if index.column() == 0:
+            return self._names[node]
+        return human_readable_size(self._sizes[node])
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Reorder every node's children in place by name or size"""
+        key = self._names if column == 0 else self._sizes
+        
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        nodes = [self._node(index) for index in old_indexes]
+        
+        for siblings in self._children.values():
+            siblings.sort(key=key.__getitem__,
+                          reverse=order == Qt.SortOrder.DescendingOrder)
+            for row, node in enumerate(siblings):
+                self._rows[node] = row
+        
+        # Keep persistent indexes (selection, current item) on their nodes
+        new_indexes = [self.createIndex(self._rows[node], index.column(), index.internalPointer())
+                       for node, index in zip(nodes, old_indexes)]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
 
 # Create a simplified FileBrowserView
 class SimpleFileBrowserView(QWidget):
@@ -91,19 +169,23 @@ class SimpleFileBrowserView(QWidget):
         header.setSectionsMovable(False)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         
-        # Create model and proxy model
+        # Create model; it sorts its own rows, so no proxy model is needed
         self.model = SimpleFileSystemModel(self)
-        self.proxy_model = QSortFilterProxyModel(self)
-        self.proxy_model.setSourceModel(self.model)
-        
-        # Set model on tree view
-        self.tree_view.setModel(self.proxy_model)
+        self.tree_view.setModel(self.model)
+        self.sort_combo.currentIndexChanged.connect(self._on_sort_changed)
         
         # Add tree view to layout
         self.layout.addWidget(self.tree_view)
         
         logger.debug("SimpleFileBrowserView initialized")
     
+    def _on_sort_changed(self, index):
+        """Sort by name ascending or by size, largest first"""
+        if self.sort_combo.itemText(index) == "Size":
+            self.model.sort(1, Qt.SortOrder.DescendingOrder)
+        else:
+            self.model.sort(0, Qt.SortOrder.AscendingOrder)
+    
     def update_view(self, scan_results, analyzer):
         """Simplified update_view that does minimal processing"""
         logger.debug("update_view called (simplified)")
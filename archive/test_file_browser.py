@@ -6,7 +6,6 @@ Test 3: MainWindow with DashboardView, FileTypesView, and FileBrowserView
 """
 
 import sys
-import os
 import logging
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QTabWidget
@@ -16,9 +15,9 @@ from PyQt6.QtCore import Qt
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("Test3")
 
-# Add src directory to path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
+# Make the src package importable
+from _test_common import add_project_root
+add_project_root()
 
 # Import UI components
 from src.ui.dashboard_view import DashboardView
@@ -1,14 +1,88 @@
 #!/usr/bin/env python3
 import os
+import stat
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Worker threads used to scan top-level subdirectories
+SCAN_WORKERS = 8
+
+# Number of files listed by the permission check
+SAMPLE_COUNT = 10
+
+# Don't descend into hidden directories such as .git or .Trash
+SKIP_HIDDEN_DIRS = True
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
 
 def human_readable_size(size):
     """Simple function to format file sizes"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024.0:
-            return f"{size:.1f} {unit}"
-        size /= 1024.0
-    return f"{size:.1f} PB"
+    # Every 10 bits of the byte count is one 1024x unit step
+    unit_index = min(max(size.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
+
+def _reraise(e):
+    raise e
+
+def _scan_tree(path, pending=None):
+    """
+    Tally everything below path (run in a worker thread). If pending is a
+    list, path's subdirectories are appended to it rather than walked.
+    Returns (total_size, file_count, dir_count, sampled, messages); messages
+    are returned rather than printed so they can be written in one batch
+    after the walk.
+    """
+    total_size = 0
+    file_count = 0
+    dir_count = 0
+    sampled = []
+    messages = []
+    
+    # Each directory gets a one-level fwalk, which hands over an fd so its
+    # files are stat'ed relative to it (fstatat) instead of re-resolving the
+    # full path each time; descending here keeps every directory's path known
+    stack = [path]
+    while stack:
+        top = stack.pop()
+        try:
+            # Listing errors are raised so they're reported against top
+            for root, dirs, files, rootfd in os.fwalk(top, onerror=_reraise):
+                # Only directories actually descended into are counted; the
+                # scan root itself isn't, and fwalk yields nothing for a symlink
+                if pending is None:
+                    dir_count += 1
+                
+                subdirs = [os.path.join(root, name) for name in dirs
+                           if not (SKIP_HIDDEN_DIRS and name.startswith('.'))]
+                dirs.clear()
+                if pending is not None:
+                    pending.extend(subdirs)
+                else:
+                    stack.extend(reversed(subdirs))
+                
+                # One try covers the directory; an error skips the rest of it
+                try:
+                    for name in files:
+                        st = os.stat(name, dir_fd=rootfd, follow_symlinks=False)
+                        if not stat.S_ISREG(st.st_mode):
+                            continue
+                        file_size = st.st_size
+                        total_size += file_size
+                        file_count += 1
+                        if len(sampled) < SAMPLE_COUNT:
+                            sampled.append((os.path.join(root, name), file_size))
+                        
+                        # Print info for some of the larger files
+                        if file_size > 1024*1024*10:  # Files larger than 10MB
+                            messages.append(f"Large file: {os.path.join(root, name)}, Size: {human_readable_size(file_size)}")
+                except OSError as e:
+                    messages.append(f"Error accessing {root}: {e}")
+                    messages.append(f"Skipping the rest of {root}")
+        except OSError as e:
+            messages.append(f"Error accessing {top}: {e}")
+    
+    return total_size, file_count, dir_count, sampled, messages
 
 def scan_directory(path):
     """Scan a directory and print file size statistics"""
@@ -18,47 +92,38 @@ def scan_directory(path):
     file_count = 0
     dir_count = 0
     
-    for root, dirs, files in os.walk(path):
-        dir_count += len(dirs)
-        for file in files:
-            file_path = os.path.join(root, file)
-            try:
-                if os.path.isfile(file_path) and not os.path.islink(file_path):
-                    file_size = os.path.getsize(file_path)
-                    total_size += file_size
-                    file_count += 1
-                    
-                    # Print info for some of the larger files
-                    if file_size > 1024*1024*10:  # Files larger than 10MB
-                        print(f"Large file: {file_path}, Size: {human_readable_size(file_size)}")
-            except (PermissionError, OSError) as e:
-                print(f"Error accessing {file_path}: {e}")
+    # Tally the top level here and hand each subdirectory to a worker;
+    # directory reads and stats release the GIL, so slow storage is read in parallel
+    subdirs = []
+    results = [_scan_tree(path, subdirs)]
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        results.extend(executor.map(_scan_tree, subdirs))
+    
+    # The first few files read, reported by the permission check below
+    sampled = []
+    messages = []
+    for size, files, dirs, subtree_sampled, subtree_messages in results:
+        total_size += size
+        file_count += files
+        dir_count += dirs
+        sampled.extend(subtree_sampled[:SAMPLE_COUNT - len(sampled)])
+        messages.extend(subtree_messages)
     
     scan_time = time.time() - start_time
-    print(f"\nScan completed in {scan_time:.2f} seconds")
-    print(f"Total files: {file_count}")
-    print(f"Total directories: {dir_count}")
-    print(f"Total size: {human_readable_size(total_size)}")
-    print(f"Total size (bytes): {total_size}")
+    messages.append(f"\nScan completed in {scan_time:.2f} seconds")
+    messages.append(f"Total files: {file_count}")
+    messages.append(f"Total directories: {dir_count}")
+    messages.append(f"Total size: {human_readable_size(total_size)}")
+    messages.append(f"Total size (bytes): {total_size}")
     
     # Check for permissions
-    print("\nChecking for permission issues...")
-    sample_count = 0
-    for root, dirs, files in os.walk(path):
-        if sample_count > 10:
-            break
-            
-        for file in files:
-            file_path = os.path.join(root, file)
-            try:
-                if os.path.isfile(file_path):
-                    size = os.path.getsize(file_path)
-                    print(f"Successfully read size of {file_path}: {size} bytes")
-                    sample_count += 1
-                    if sample_count >= 10:
-                        break
-            except Exception as e:
-                print(f"Error: {e} for {file_path}")
+    messages.append("\nChecking for permission issues...")
+    for file_path, size in sampled:
+        messages.append(f"Successfully read size of {file_path}: {size} bytes")
+    
+    # The whole report is written in one go once the walk is done
+    sys.stdout.write("\n".join(messages) + "\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     scan_directory("/Users/moonseer/Downloads") 
\ No newline at end of file
@@ -6,55 +6,72 @@ Test 2: MainWindow with DashboardView and FileTypesView
 """
 
 import sys
-import os
 import logging
 
-from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QTabWidget
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import Qt, QSignalBlocker
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("Test2")
 
-# Add src directory to path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
+# Make the src package importable
+from _test_common import BaseTestWindow, add_project_root
+add_project_root()
 
 # Import UI components
 from src.ui.dashboard_view import DashboardView
-from src.ui.file_types_view import FileTypesView
 
-class TestMainWindow(QMainWindow):
+def _create_file_types_view():
+    from src.ui.file_types_view import FileTypesView
+    return FileTypesView()
+
+class TestMainWindow(BaseTestWindow):
     def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Test 2: DashboardView and FileTypesView")
-        self.resize(800, 600)
+        super().__init__("Test 2: DashboardView and FileTypesView")
+        
+        # Views that are only built (and imported) when their tab is first shown
+        self.file_types_view = None
+        self._view_factories = {
+            1: ("file_types_view", _create_file_types_view),
+        }
         
         # Setup UI
-        self._setup_ui()
+        self._build_ui()
     
     def _setup_ui(self):
         """Set up the user interface"""
-        # Create central widget
-        self.central_widget = QWidget()
-        self.setCentralWidget(self.central_widget)
-        
-        # Create layout
-        main_layout = QVBoxLayout(self.central_widget)
-        
-        # Create tab widget
-        self.tab_widget = QTabWidget()
-        
-        # Create Dashboard view
-        self.dashboard_view = DashboardView()
-        self.tab_widget.addTab(self.dashboard_view, "Dashboard")
+        super()._setup_ui([
+            ("dashboard_view", DashboardView(), "Dashboard"),
+        ])
+        self.tab_widget.addTab(QWidget(), "File Types")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+    
+    def _on_tab_changed(self, index):
+        """Replace a placeholder tab with its real view on first activation"""
+        entry = self._view_factories.get(index)
+        if entry is None:
+            return
         
-        # Create FileTypes view
-        self.file_types_view = FileTypesView()
-        self.tab_widget.addTab(self.file_types_view, "File Types")
+        attr, factory = entry
+        try:
+            view = factory()
+        except Exception:
+            # Leave the placeholder; selecting the tab again retries
+            logger.exception("Error creating %s", attr)
+            return
+        del self._view_factories[index]
+        setattr(self, attr, view)
         
-        # Add tab widget to main layout
-        main_layout.addWidget(self.tab_widget)
+        # Swap the placeholder for the real view without re-entering this slot
+        label = self.tab_widget.tabText(index)
+        placeholder = self.tab_widget.widget(index)
+        with QSignalBlocker(self.tab_widget):
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, view, label)
+            self.tab_widget.setCurrentIndex(index)
+        placeholder.deleteLater()
+        logger.info("Created %s on first activation", attr)
 
 def main():
     # Create application
@@ -6,37 +6,36 @@ Test with corrected signal parameter order
 """
 
 import sys
-import os
 import logging
 
-from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QVBoxLayout, QWidget, QTabWidget, 
-    QStatusBar, QProgressBar, QPushButton, QToolBar
-)
+from PyQt6.QtWidgets import QApplication, QStatusBar, QProgressBar, QPushButton, QToolBar
 from PyQt6.QtCore import Qt
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("FixedSignalTest")
 
-# Add src directory to path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
+# Minimum interval between progress UI updates, in seconds (~30 Hz)
+PROGRESS_UPDATE_INTERVAL = 0.033
+
+# Make the src package importable
+from _test_common import BaseTestWindow, ProgressThrottle, add_project_root
+add_project_root()
 
 # Import core modules
 from src.core.scanner import DiskScanner
 from src.core.analyzer import DataAnalyzer
 
-class TestMainWindow(QMainWindow):
+class TestMainWindow(BaseTestWindow):
     def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Test with Fixed Signal Order")
-        self.resize(800, 600)
+        super().__init__("Test with Fixed Signal Order")
         
         # Create scanner and analyzer
         self.scanner = DiskScanner()
         self.analyzer = DataAnalyzer()
         
+        self._progress_throttle = ProgressThrottle(PROGRESS_UPDATE_INTERVAL)
+        
         # Connect scanner signals with correct parameter order
         try:
             logger.info("Connecting scanner signals")
@@ -55,16 +54,11 @@ class TestMainWindow(QMainWindow):
             logger.error(f"Error connecting signals: {e}")
         
         # Setup UI
-        self._setup_ui()
+        self._build_ui()
     
     def _setup_ui(self):
         """Set up the user interface"""
-        # Create central widget
-        self.central_widget = QWidget()
-        self.setCentralWidget(self.central_widget)
-        
-        # Create layout
-        main_layout = QVBoxLayout(self.central_widget)
+        main_layout = super()._setup_ui()
         
         # Create toolbar
         toolbar = QToolBar("Main Toolbar")
@@ -132,6 +126,9 @@ class TestMainWindow(QMainWindow):
         Signal definition: scan_progress = pyqtSignal(int, int, str)
         Parameters: current, total, current_path
         """
+        if not self._progress_throttle.ready(current, total):
+            return
+        
         try:
             logger.info(f"Progress signal received: current={current}, total={total}, path={current_path}")
             
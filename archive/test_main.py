@@ -14,10 +14,15 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QTimer, QSettings
 
+from mock_classes import MockSignal
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("TestApp")
 
+# Shared by every SimplifiedMainWindow; created with the first window
+_SETTINGS = None
+
 # Create placeholder classes
 class PlaceholderView(QWidget):
     """Placeholder for custom views"""
@@ -69,18 +74,6 @@ class MockAnalyzer:
     def get_duplicate_files(self, results):
         return {}
 
-class MockSignal:
-    """Mock PyQt signal"""
-    def __init__(self):
-        self.callbacks = []
-    
-    def connect(self, callback):
-        self.callbacks.append(callback)
-    
-    def emit(self, *args):
-        for callback in self.callbacks:
-            callback(*args)
-
 class SimplifiedMainWindow(QMainWindow):
     """Simplified main window for testing"""
     
@@ -93,9 +86,15 @@ class SimplifiedMainWindow(QMainWindow):
         self.analyzer = MockAnalyzer()
         self.current_scan_path = None
         self.scan_results = None
-        self.settings = QSettings("StorageStats", "TestApp")
+        global _SETTINGS
+        if _SETTINGS is None:
+            _SETTINGS = QSettings("StorageStats", "TestApp")
+        self.settings = _SETTINGS
         self.scan_in_progress = False
         
+        # Tab index -> id() of the scan results that tab was last updated with
+        self._rendered = {}
+        
         # Set up window properties
         self.setWindowTitle("Storage Stats - Test")
         self.setGeometry(100, 100, 1000, 700)
@@ -131,6 +130,9 @@ class SimplifiedMainWindow(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
+        # No repaints while the scan row and the tabs are added
+        central_widget.setUpdatesEnabled(False)
+        
         # Create main layout
         main_layout = QVBoxLayout(central_widget)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -180,6 +182,8 @@ class SimplifiedMainWindow(QMainWindow):
         
         # Connect tab change signal
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
+        
+        central_widget.setUpdatesEnabled(True)
     
     def _on_scan_action(self):
         """Handle scan button click"""
@@ -209,10 +213,14 @@ class SimplifiedMainWindow(QMainWindow):
         self.scan_in_progress = False
         self.scan_results = results
         
+        # New results; every tab needs updating again
+        self._rendered.clear()
+        
         # Update the current tab with results
         current_tab = self.tab_widget.currentWidget()
         if hasattr(current_tab, 'update_view'):
             current_tab.update_view(results, self.analyzer)
+            self._rendered[self.tab_widget.currentIndex()] = id(results)
         
         self.status_bar.showMessage("Scan completed")
     
@@ -227,11 +235,13 @@ class SimplifiedMainWindow(QMainWindow):
         tab_name = self.tab_widget.tabText(index)
         logger.info(f"Tab changed to: {tab_name}")
         
-        # Update the new tab with scan results if available
-        if self.scan_results:
+        # Update the new tab with scan results if available and not shown yet
+        key = id(self.scan_results)
+        if self.scan_results and self._rendered.get(index) != key:
             tab_widget = self.tab_widget.widget(index)
             if hasattr(tab_widget, 'update_view'):
                 tab_widget.update_view(self.scan_results, self.analyzer)
+                self._rendered[index] = key
         
         self.status_bar.showMessage(f"Viewing {tab_name}")
 
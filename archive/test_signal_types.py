@@ -6,20 +6,19 @@ Test signal signatures of the DiskScanner class
 """
 
 import sys
-import os
 import logging
 import inspect
 
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QMetaMethod, pyqtSignal
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("SignalTest")
 
-# Add src directory to path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
+# Make the src package importable
+from _test_common import add_project_root
+add_project_root()
 
 def main():
     app = QApplication(sys.argv)
@@ -61,29 +60,25 @@ def main():
             # But this is internal PyQt info and not easily accessible
             # We'll rely on documentation instead
         
-        # Get signal documentation from scanner.py
-        with open(os.path.join(src_dir, "core", "scanner.py"), "r") as f:
-            scanner_code = f.read()
+        # Read the signal signatures from the Qt meta-object instead of the source
+        meta = scanner.metaObject()
+        own_signals = []
+        for i in range(meta.methodCount()):
+            method = meta.method(i)
+            if method.methodType() != QMetaMethod.MethodType.Signal:
+                continue
+            name = bytes(method.name()).decode()
+            param_list = [bytes(t).decode() for t in method.parameterTypes()]
+            logger.info(f"Signal definition: {name}({', '.join(param_list)})")
             
-        # Find signal definitions
-        import re
-        signal_defs = re.findall(r"(\w+)\s*=\s*pyqtSignal\(([^)]*)\)", scanner_code)
-        for name, params in signal_defs:
-            logger.info(f"Signal definition: {name} = pyqtSignal({params})")
+            # Methods below methodOffset() are inherited from QObject
+            if i >= meta.methodOffset():
+                own_signals.append((name, param_list))
         
-        # Look for the DiskScanner class definition
-        disk_scanner_class = re.search(r"class DiskScanner\([^)]*\):(.*?)class", scanner_code, re.DOTALL)
-        if disk_scanner_class:
-            class_code = disk_scanner_class.group(1)
-            # Find signal definitions within the class
-            signal_defs = re.findall(r"(\w+)\s*=\s*pyqtSignal\(([^)]*)\)", class_code)
-            logger.info(f"Found {len(signal_defs)} signal definitions in DiskScanner class")
-            for name, params in signal_defs:
-                logger.info(f"  Signal: {name} = pyqtSignal({params})")
-                
-                # Analyze parameters
-                param_list = [p.strip() for p in params.split(',') if p.strip()]
-                logger.info(f"  Parameters: {param_list}")
+        logger.info(f"Found {len(own_signals)} signal definitions in DiskScanner class")
+        for name, param_list in own_signals:
+            logger.info(f"  Signal: {name}({', '.join(param_list)})")
+            logger.info(f"  Parameters: {param_list}")
         
         return 0
     except Exception as e:
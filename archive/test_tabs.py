@@ -33,6 +33,9 @@ class TabTest(QMainWindow):
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         
+        # Paint once, after the buttons and tab pages below exist
+        central_widget.setUpdatesEnabled(False)
+        
         # Create main layout
         main_layout = QVBoxLayout(central_widget)
         
@@ -74,6 +77,8 @@ class TabTest(QMainWindow):
         simulate_button = QPushButton("Simulate Scan")
         simulate_button.clicked.connect(self.simulate_scan)
         main_layout.addWidget(simulate_button)
+        
+        central_widget.setUpdatesEnabled(True)
 
     def on_tab_changed(self, index):
         """Handle tab change signal"""
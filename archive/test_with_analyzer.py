@@ -174,11 +174,12 @@ class TestMainWindow(QMainWindow):
             config = {}  # Add any configuration needed
             self.scanner.configure(config)
             
-            # Start scan
+            # Start scan; the mock scanner may finish before scan() returns,
+            # so the scanning state is shown first
             logger.info(f"Starting scan of {directory}")
-            self.scanner.scan(directory)
             self.status_bar.showMessage(f"Scanning {directory}...")
             self.stop_button.setEnabled(True)
+            self.scanner.scan(directory)
     
     def _on_stop_scan(self):
         """Handle stop scan button click"""
@@ -5,7 +5,6 @@ Test 4: MainWindow with views and core modules
 """
 
 import sys
-import os
 import logging
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QTabWidget, QStatusBar
@@ -15,9 +14,9 @@ from PyQt6.QtCore import Qt
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("Test4")
 
-# Add src directory to path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
+# Make the src package importable
+from _test_common import add_project_root
+add_project_root()
 
 # Import core modules
 from src.core.scanner import DiskScanner
@@ -6,7 +6,6 @@ Test 5: MainWindow with views, core modules, and signal connections
 """
 
 import sys
-import os
 import logging
 
 from PyQt6.QtWidgets import (
@@ -19,9 +18,9 @@ from PyQt6.QtCore import Qt
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("Test5")
 
-# Add src directory to path
-src_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-sys.path.insert(0, src_dir)
+# Make the src package importable
+from _test_common import add_project_root
+add_project_root()
 
 # Import core modules
 from src.core.scanner import DiskScanner
@@ -14,6 +14,7 @@ Usage:
 import os
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -23,14 +24,18 @@ logging.basicConfig(
 logger = logging.getLogger("Cleanup")
 
 # Essential files to preserve (not to be moved)
-ESSENTIAL_FILES = [
+ESSENTIAL_FILES = frozenset({
     'main.py',
     'README.md',
     'PROGRESS.md',
     'requirements.txt',
     '.gitignore',
     'cleanup.py'  # Don't move self
-]
+})
+
+# Worker threads used to move files; moves are I/O bound, so more threads
+# than cores helps hide per-file latency
+MOVE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 # Create archive folder
 def create_archive_folder():
@@ -46,38 +51,55 @@ def create_archive_folder():
         logger.info(f"Created archive folder: {archive_path}")
     return archive_path
 
-def should_move_file(filename):
+def should_move_file(entry):
     """
-    Determine if a file should be moved to the archive.
+    Determine if a directory entry should be moved to the archive.
     
     Args:
-        filename (str): Name of the file to check
+        entry (os.DirEntry): Entry from os.scandir; its name and cached
+            type are checked, so no stat() is needed
         
     Returns:
-        bool: True if the file should be moved, False otherwise
+        bool: True if the entry should be moved, False otherwise
     """
+    name = entry.name
+    
     # Don't move essential files
-    if filename in ESSENTIAL_FILES:
+    if name in ESSENTIAL_FILES:
         return False
     
     # Don't move directories
-    if os.path.isdir(filename) and not filename.startswith('.'):
+    if entry.is_dir() and not name.startswith('.'):
         return False
     
-    # Move all Python test/debug files
-    if filename.endswith('.py') and filename != 'main.py':
-        return True
-    
-    # Move log files
-    if filename.endswith('.log'):
+    # Move all Python test/debug files and log files (main.py is essential)
+    if name.endswith(('.py', '.log')):
         return True
     
     # Move specific debug files
-    if 'debug' in filename.lower() or 'test' in filename.lower():
+    lower_name = name.lower()
+    if 'debug' in lower_name or 'test' in lower_name:
         return True
     
     return False
 
+def move_file(source_path, dest_path):
+    """
+    Move a file, returning the error instead of raising it.
+    
+    Args:
+        source_path (str): Path of the file to move
+        dest_path (str): Destination path
+        
+    Returns:
+        Exception: The error raised by the move, or None on success
+    """
+    try:
+        shutil.move(source_path, dest_path)
+    except Exception as e:
+        return e
+    return None
+
 def main():
     """
     Main function to archive test and debug files.
@@ -87,22 +109,32 @@ def main():
     # Create archive folder
     archive_path = create_archive_folder()
     
-    # Get list of files in current directory
-    files = [f for f in os.listdir('.') if os.path.isfile(f) or (os.path.isdir(f) and not f.startswith('.'))]
+    # Get list of files in current directory; scandir entries carry their
+    # type, so the file/directory checks don't need a stat() each
+    with os.scandir('.') as it:
+        entries = [entry for entry in it if entry.is_file() or (entry.is_dir() and not entry.name.startswith('.'))]
+    
+    # Collect the files to move
+    filenames = []
+    source_paths = []
+    dest_paths = []
+    for entry in entries:
+        if should_move_file(entry):
+            filenames.append(entry.name)
+            source_paths.append(entry.path)
+            dest_paths.append(os.path.join(archive_path, entry.name))
+    
+    # Move files to archive in parallel; results are logged here afterwards
+    with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as executor:
+        errors = list(executor.map(move_file, source_paths, dest_paths))
     
-    # Move files to archive
     moved_count = 0
-    for filename in files:
-        if should_move_file(filename):
-            source_path = os.path.join(os.getcwd(), filename)
-            dest_path = os.path.join(archive_path, filename)
-            
-            try:
-                shutil.move(source_path, dest_path)
-                logger.info(f"Moved: {filename} -> {dest_path}")
-                moved_count += 1
-            except Exception as e:
-                logger.error(f"Failed to move {filename}: {e}")
+    for filename, dest_path, error in zip(filenames, dest_paths, errors):
+        if error is None:
+            logger.info(f"Moved: {filename} -> {dest_path}")
+            moved_count += 1
+        else:
+            logger.error(f"Failed to move {filename}: {error}")
     
     logger.info(f"Cleanup completed. Moved {moved_count} files to {archive_path}")
 
@@ -562,15 +562,9 @@ class MainWindow(QMainWindow):
     def _on_scan_progress(self, current, total, current_path):
         """Handle scan progress signal"""
         try:
-            # Convert parameters to integers if they're strings
-            if isinstance(total, str):
-                total = int(total)
-            if isinstance(current, str):
-                current = int(current)
-                
+            # The slot is typed (int, int, str), so no coercion is needed
             if total > 0:
-                percent = int((current / total) * 100)
-                self.progress_bar.setValue(percent)
+                self.progress_bar.setValue((current * 100) // total)
             self.status_bar.showMessage(f"Scanning: {current_path}")
         except Exception as e:
             logger.error(f"Error in scan progress handler: {e}")
@@ -70,8 +70,9 @@ def human_readable_size(size, preferred_unit=None, decimal_places=1):
             # Round to specified decimal places for preferred units
             return f"{round(value, decimal_places):.{decimal_places}f} {preferred_unit}"
     
-    # Otherwise, pick the unit index by size
-    unit_index = min(int(math.log(size, base)), len(units) - 1)
+    # Otherwise, pick the unit index by size; each unit spans 10 bits, so the
+    # integer bit length gives it directly without a floating-point log
+    unit_index = min(max(int(size).bit_length() - 1, 0) // 10, len(units) - 1)
     value = size / (base ** unit_index)
     
     # For bytes, skip decimal places
@@ -42,6 +42,23 @@ class TestHumanReadableSize:
         assert human_readable_size(1.5 * 1024 * 1024 * 1024 * 1024) == "1.5 TB"
         assert human_readable_size(10 * 1024 * 1024 * 1024 * 1024) == "10.0 TB"
 
+    def test_unit_boundaries(self):
+        """Test values on either side of a unit boundary."""
+        assert human_readable_size(1023) == "1023 B"
+        assert human_readable_size(1024 ** 2 - 1) == "1023.9 KB"
+        assert human_readable_size(1024 ** 5) == "1.0 PB"
+        assert human_readable_size(0.5) == "0 B"
+
+    def test_large_unit_boundaries(self):
+        """Test exact powers of 1024 and the byte just below them for large units."""
+        units = ['KB', 'MB', 'GB', 'TB', 'PB', 'EB', 'ZB', 'YB']
+        for exponent, unit in enumerate(units, start=1):
+            assert human_readable_size(1024 ** exponent) == f"1.0 {unit}"
+        # One byte below a boundary stays in the smaller unit; a floating-point
+        # log rounds up here and would give "0.9 PB"
+        assert human_readable_size(1024 ** 4 - 1) == "1023.9 GB"
+        assert human_readable_size(1024 ** 5 - 1) == "1023.9 TB"
+
     def test_preferred_unit(self):
         """Test that preferred_unit option works correctly."""
         # Test that KB is used when preferred